@@ -4,4 +4,29 @@ PyCLIDE Server - High-performance Python semantic analysis server.
 Provides persistent caching and hot-reload capabilities for Python code analysis.
 """
 
+import importlib
+
 __version__ = "1.0.0"
+
+# Public names resolved on first access (PEP 562), so importing the package
+# does not pull in Jedi, Rope or FastAPI until they are actually needed.
+_LAZY_EXPORTS = {
+    "PyCLIDEServer": ".server",
+    "RopeEngine": ".rope_engine",
+    "jedi_script": ".jedi_helpers",
+    "jedi_to_locations": ".jedi_helpers",
+}
+
+__all__ = ["__version__", *_LAZY_EXPORTS]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -30,6 +30,7 @@ class RefsRequest(BaseModel):
     line: int = Field(..., description="1-based line number")
     col: int = Field(..., description="1-based column number")
     root: str = Field(..., description="Workspace root path")
+    scope: Literal["project", "file"] = Field("project", description="Search scope: 'project' for the whole workspace, 'file' for the requested file only")
 
 
 class HoverRequest(BaseModel):
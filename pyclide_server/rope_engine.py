@@ -308,6 +308,9 @@ class RopeEngine:
         for f in targets:
             res = path_to_resource(self.project, str(f.resolve()))
             src = res.read()
+            if "import" not in src:
+                # Every import statement contains the keyword: nothing to organize
+                continue
 
             try:
                 changes = org.organize_imports(res)
@@ -7,7 +7,7 @@ import logging
 import time
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 import jedi
 from fastapi import FastAPI, HTTPException
@@ -21,7 +21,9 @@ from .models import (
     OrganizeImportsRequest, MoveRequest, HealthResponse, LocationsResponse, HoverInfo, PatchesResponse,
     Location
 )
-from .rope_engine import RopeEngine
+
+if TYPE_CHECKING:
+    from .rope_engine import RopeEngine
 
 # Get logger (configuration done in __main__.py)
 logger = logging.getLogger(__name__)
@@ -51,7 +53,7 @@ class PyCLIDEServer:
 
         # Hot state in RAM
         self.jedi_cache: Dict[str, jedi.Script] = {}
-        self.rope_engine: Optional[RopeEngine] = None
+        self.rope_engine: Optional["RopeEngine"] = None
 
         # Statistics
         self.start_time = time.time()
@@ -94,9 +96,12 @@ class PyCLIDEServer:
 
         logger.info(f"Initialized server for workspace: {self.root}")
 
-    def _get_rope_engine(self) -> RopeEngine:
+    def _get_rope_engine(self) -> "RopeEngine":
         """Get or create Rope engine (lazy initialization)."""
         if self.rope_engine is None:
+            # Deferred so Rope is only imported once a refactoring is requested
+            from .rope_engine import RopeEngine
+
             logger.info("Initializing Rope project...")
             self.rope_engine = RopeEngine(self.root)
         return self.rope_engine
@@ -199,7 +204,7 @@ class PyCLIDEServer:
                 self._update_activity()
 
                 script = self._get_cached_script(req.file)
-                results = script.get_references(req.line, req.col)
+                results = script.get_references(req.line, req.col, scope=req.scope)
                 locations = jedi_to_locations(results)
 
                 return LocationsResponse(
@@ -270,18 +270,33 @@ def handle_defs(args: List[str], root: str) -> None:
 def handle_refs(args: List[str], root: str) -> None:
     """Handle 'refs' command (find references)."""
     if len(args) < 3:
-        print("Usage: pyclide_client.py refs <file> <line> <col> [--root <root>]", file=sys.stderr)
+        print("Usage: pyclide_client.py refs <file> <line> <col> [--scope <project|file>] [--root <root>]", file=sys.stderr)
         sys.exit(1)
 
     file_path, line, col = args[0], int(args[1]), int(args[2])
+
+    # Parse optional --scope
+    scope = None
+    if "--scope" in sys.argv:
+        idx = sys.argv.index("--scope")
+        if idx + 1 < len(sys.argv):
+            scope = sys.argv[idx + 1]
+            if scope not in ("project", "file"):
+                print(f"Error: --scope must be 'project' or 'file', got '{scope}'", file=sys.stderr)
+                sys.exit(1)
+
     server_info = get_or_start_server(root)
 
-    result = send_request(server_info, "refs", {
+    request_data = {
         "file": file_path,
         "line": line,
         "col": col,
         "root": root
-    })
+    }
+    if scope is not None:
+        request_data["scope"] = scope
+
+    result = send_request(server_info, "refs", request_data)
 
     print(json.dumps(result, indent=2))
 
@@ -449,6 +464,10 @@ def handle_organize_imports(args: List[str], root: str, output_format: str = "di
 # Local Commands (No Server Required)
 # ============================================================================
 
+# Top-level node types reported by 'list', by exact AST class
+_LIST_SYMBOL_KINDS = {ast.ClassDef: "class", ast.FunctionDef: "function"}
+
+
 def handle_list(args: List[str], root: str) -> None:
     """Handle 'list' command (list top-level symbols via AST parsing)."""
     if len(args) < 1:
@@ -469,25 +488,19 @@ def handle_list(args: List[str], root: str) -> None:
     symbols = []
     for file in files:
         try:
-            tree = ast.parse(file.read_text(encoding="utf-8"))
+            tree = ast.parse(file.read_bytes())
         except Exception:
             continue  # Skip files with syntax errors
 
+        rel_path = str(file.relative_to(rootp)) if file.is_relative_to(rootp) else str(file)
+
         # Extract top-level classes and functions
         for node in tree.body:
-            rel_path = str(file.relative_to(rootp)) if file.is_relative_to(rootp) else str(file)
-
-            if isinstance(node, ast.ClassDef):
-                symbols.append({
-                    "path": rel_path,
-                    "kind": "class",
-                    "name": node.name,
-                    "line": node.lineno
-                })
-            elif isinstance(node, ast.FunctionDef):
+            kind = _LIST_SYMBOL_KINDS.get(type(node))
+            if kind:
                 symbols.append({
                     "path": rel_path,
-                    "kind": "function",
+                    "kind": kind,
                     "name": node.name,
                     "line": node.lineno
                 })
@@ -554,7 +567,7 @@ def main() -> None:
         print("Usage: python pyclide_client.py <command> [args...] [--root <root>]", file=sys.stderr)
         print("\nNavigation Commands (Jedi):", file=sys.stderr)
         print("  defs <file> <line> <col>                           - Go to definition", file=sys.stderr)
-        print("  refs <file> <line> <col>                           - Find references", file=sys.stderr)
+        print("  refs <file> <line> <col> [--scope project|file]    - Find references", file=sys.stderr)
         print("  hover <file> <line> <col>                          - Symbol information", file=sys.stderr)
         print("\nRefactoring Commands (Rope):", file=sys.stderr)
         print("  occurrences <file> <line> <col>                    - Semantic occurrences", file=sys.stderr)
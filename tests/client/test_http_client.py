@@ -4,15 +4,12 @@ send_request() is critical - handles all client-server HTTP communication with r
 """
 
 import json
-import sys
-from pathlib import Path
 from unittest.mock import patch, MagicMock, Mock
 from urllib.error import URLError
 
 import pytest
 
 # Import client
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "skills" / "pyclide"))
 from pyclide_client import send_request
 
 
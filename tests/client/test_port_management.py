@@ -4,14 +4,11 @@ Port management is critical for server lifecycle - ensures no port conflicts.
 """
 
 import socket
-import sys
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
 # Import client
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "skills" / "pyclide"))
 from pyclide_client import is_port_available, allocate_port
 
 
@@ -5,15 +5,14 @@ Critical for server lifecycle management.
 """
 
 import json
-import sys
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 # Import client
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "skills" / "pyclide"))
 from pyclide_client import (
     get_registry_path,
     load_registry,
@@ -340,7 +339,6 @@ class TestAddServer:
         workspace = tmp_path / "project"
         workspace.mkdir()
 
-        import time
         before = time.time()
         add_server(str(workspace), 8000)
         after = time.time()
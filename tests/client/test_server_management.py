@@ -5,7 +5,6 @@ Server lifecycle management is critical - handles startup, health checks, recove
 
 import json
 import subprocess
-import sys
 import time
 from pathlib import Path
 from unittest.mock import patch, MagicMock, Mock
@@ -14,7 +13,6 @@ from urllib.error import URLError
 import pytest
 
 # Import client
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "skills" / "pyclide"))
 from pyclide_client import (
     is_server_healthy,
     check_uvx_available,
@@ -2,16 +2,24 @@
 
 import asyncio
 import json
+import os
 import shutil
+import sys
 import tempfile
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 import pytest
+
+# Make the skill client (skills/pyclide/pyclide_client.py) importable once for all test modules
+_CLIENT_DIR = str(Path(__file__).parent.parent / "skills" / "pyclide")
+if _CLIENT_DIR not in sys.path:
+    sys.path.insert(0, _CLIENT_DIR)
 from fastapi.testclient import TestClient
 
-# Import server components
-from pyclide_server.server import PyCLIDEServer
+# Server components are resolved lazily, so collecting client-only tests skips Jedi/Rope
+import pyclide_server
+from tests.utils import ignore_non_python, link_or_copy, tree_digest
 
 
 def pytest_configure(config):
@@ -29,7 +37,7 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "unix: Unix-specific tests")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir():
     """Return the fixtures directory path."""
     return Path(__file__).parent / "fixtures"
@@ -42,14 +50,43 @@ def temp_workspace(tmp_path, fixtures_dir):
 
     Copies all fixture files to a temporary directory for isolated testing.
     """
-    # Copy all Python files from fixtures
-    for file in fixtures_dir.rglob("*.py"):
-        relative_path = file.relative_to(fixtures_dir)
-        dest_file = tmp_path / relative_path
-        dest_file.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy(file, dest_file)
+    return _copy_fixtures(fixtures_dir, tmp_path)
+
 
-    return tmp_path
+@pytest.fixture(scope="session")
+def shared_workspace(tmp_path_factory, fixtures_dir):
+    """
+    Session-wide workspace with the fixture files, built once.
+
+    Read-only: files are hardlinked to tests/fixtures, so tests using it must
+    not create or modify files. Use temp_workspace for tests that write.
+
+    Under pytest-xdist each worker builds its own copy: the hardlinks make it
+    cheap, and each worker's server needs a private .ropeproject folder.
+    """
+    return _copy_fixtures(fixtures_dir, tmp_path_factory.mktemp("shared_workspace"), link=True)
+
+
+def _copy_fixtures(fixtures_dir: Path, dest: Path, link: bool = False) -> Path:
+    """
+    Copy all Python fixture files (contents only) into dest, preserving layout.
+
+    With link=True files are hardlinked to the originals instead. Only use it
+    for read-only workspaces: writing to a linked file edits tests/fixtures.
+    """
+    copy_function = link_or_copy if link else shutil.copyfile
+    shutil.copytree(
+        fixtures_dir, dest, ignore=ignore_non_python, copy_function=copy_function, dirs_exist_ok=True
+    )
+    return dest
+
+
+def _close_server(server: "pyclide_server.PyCLIDEServer"):
+    """Release the file watcher and Rope project held by a test server."""
+    if server.file_watcher:
+        server.file_watcher.stop()
+    if server.rope_engine:
+        server.rope_engine.project.close()
 
 
 @pytest.fixture
@@ -61,7 +98,7 @@ def test_server(temp_workspace):
     The server is automatically cleaned up after the test.
     """
     # Create server instance (don't start it, just use the FastAPI app)
-    server = PyCLIDEServer(str(temp_workspace), port=5555)
+    server = pyclide_server.PyCLIDEServer(str(temp_workspace), port=5555)
 
     # Create TestClient for making requests
     client = TestClient(server.app)
@@ -69,10 +106,7 @@ def test_server(temp_workspace):
     yield server, client
 
     # Cleanup
-    if server.file_watcher:
-        server.file_watcher.stop()
-    if server.rope_engine:
-        server.rope_engine.project.close()
+    _close_server(server)
 
 
 @pytest.fixture
@@ -86,6 +120,93 @@ def httpx_client(test_server):
     return client
 
 
+@pytest.fixture(scope="session")
+def rope_engine_cache():
+    """
+    Session-wide RopeEngine cache keyed by project tree content.
+
+    Returns a callable ``get_engine(root)``. Trees whose .py files are
+    identical share one engine, so read-only tests on the same sources skip
+    Rope project setup. A cached engine whose own tree was modified since is
+    rebuilt, and all projects are closed at the end of the session.
+    """
+    engines: Dict[str, pyclide_server.RopeEngine] = {}
+
+    def get_engine(root: Path) -> pyclide_server.RopeEngine:
+        digest = tree_digest(root)
+        engine = engines.get(digest)
+        if engine is not None and engine.root != root.resolve():
+            if tree_digest(engine.root) != digest:
+                engine.project.close()
+                engine = None
+        if engine is None:
+            engine = engines[digest] = pyclide_server.RopeEngine(root)
+        return engine
+
+    yield get_engine
+
+    for engine in engines.values():
+        engine.project.close()
+
+
+@pytest.fixture(scope="session")
+def shared_client(shared_workspace):
+    """
+    TestClient for a server on shared_workspace, reused across the session.
+
+    Jedi scripts and the Rope project stay warm between tests. Only use it
+    for read-only requests that do not assert on server statistics.
+    """
+    server = pyclide_server.PyCLIDEServer(str(shared_workspace), port=5555)
+
+    yield TestClient(server.app)
+
+    _close_server(server)
+
+
+@pytest.fixture(scope="session")
+def server_factory():
+    """
+    Session-wide factory for TestClients on prebuilt workspaces.
+
+    Returns a callable ``make_client(root)``. Meant for module-scoped
+    fixtures that write their sources once and then only send read-only
+    requests. All servers are closed at the end of the session.
+    """
+    servers: List[pyclide_server.PyCLIDEServer] = []
+
+    def make_client(root: Path) -> TestClient:
+        server = pyclide_server.PyCLIDEServer(str(root), port=5555)
+        servers.append(server)
+        return TestClient(server.app)
+
+    yield make_client
+
+    for server in servers:
+        _close_server(server)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_engines(request, tmp_path_factory):
+    """
+    Pay Jedi and Rope first-use costs once, up front.
+
+    Builds a throwaway RopeEngine and runs one Jedi completion so the first
+    real test does not absorb the import and initialization time. Skipped
+    when the session collected no jedi- or rope-marked tests.
+    """
+    if not any(
+        item.get_closest_marker("jedi") or item.get_closest_marker("rope")
+        for item in request.session.items
+    ):
+        return
+
+    root = tmp_path_factory.mktemp("warmup")
+    (root / "warm.py").write_bytes(b"x = 1\n")
+    pyclide_server.RopeEngine(root).project.close()
+    pyclide_server.jedi_script(root, "warm.py").complete(1, 1)
+
+
 @pytest.fixture
 def sample_files(temp_workspace, fixtures_dir):
     """
@@ -16,7 +16,6 @@ Run with: pytest -m e2e
 Skip with: pytest -m "not e2e" (default)
 """
 
-import json
 import shutil
 import sys
 import time
@@ -26,7 +25,6 @@ from unittest.mock import patch
 import pytest
 
 # Import client for testing
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "skills" / "pyclide"))
 from pyclide_client import (
     handle_defs,
     handle_refs,
@@ -42,18 +40,24 @@ from pyclide_client import (
     save_registry,
     remove_server,
 )
+from tests.utils import ignore_non_python, link_or_copy, parse_json
+
+# Probe PATH once for the whole module rather than once per test class
+requires_uvx = pytest.mark.skipif(shutil.which("uvx") is None, reason="uvx not available")
 
 
 @pytest.fixture
 def e2e_workspace(tmp_path, fixtures_dir):
     """Create temporary workspace for E2E tests."""
-    # Copy fixtures to temp workspace
-    for file in fixtures_dir.rglob("*.py"):
-        if file.name != "invalid_syntax.py":
-            relative_path = file.relative_to(fixtures_dir)
-            dest_file = tmp_path / relative_path
-            dest_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy(file, dest_file)
+    # Link Python fixtures (except the broken one) into the temp workspace;
+    # tests only add new files next to them, never edit the linked ones
+    shutil.copytree(
+        fixtures_dir,
+        tmp_path,
+        ignore=lambda directory, names: [*ignore_non_python(directory, names), "invalid_syntax.py"],
+        copy_function=link_or_copy,
+        dirs_exist_ok=True,
+    )
     return tmp_path
 
 
@@ -111,7 +115,7 @@ def temp_registry(tmp_path, monkeypatch):
 
 
 @pytest.mark.e2e
-@pytest.mark.skipif(not shutil.which("uvx"), reason="uvx not available")
+@requires_uvx
 class TestDefsCommandE2E:
     """E2E tests for 'defs' command (go to definition)."""
 
@@ -125,7 +129,7 @@ class TestDefsCommandE2E:
 
         # Capture output
         captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data = parse_json(captured.out)
 
         # Verify locations response
         assert "locations" in data
@@ -144,7 +148,7 @@ class TestDefsCommandE2E:
         )
 
         captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data = parse_json(captured.out)
 
         assert "locations" in data
         assert len(data["locations"]) > 0
@@ -157,11 +161,11 @@ class TestDefsCommandE2E:
         )
 
         captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data = parse_json(captured.out)
 
         # Should return empty locations
         assert "locations" in data
-        assert isinstance(data["locations"], list)
+        assert type(data["locations"]) is list
 
     def test_defs_invalid_file_path(self, e2e_workspace, temp_registry, capsys):
         """Test with invalid file path (full E2E)."""
@@ -174,7 +178,7 @@ class TestDefsCommandE2E:
             )
             # If successful, verify response structure
             captured = capsys.readouterr()
-            data = json.loads(captured.out)
+            data = parse_json(captured.out)
             assert "locations" in data
         except (SystemExit, Exception):
             # Also acceptable - server returned error
@@ -182,7 +186,7 @@ class TestDefsCommandE2E:
 
 
 @pytest.mark.e2e
-@pytest.mark.skipif(not shutil.which("uvx"), reason="uvx not available")
+@requires_uvx
 class TestRefsCommandE2E:
     """E2E tests for 'refs' command (find references)."""
 
@@ -194,7 +198,7 @@ class TestRefsCommandE2E:
         )
 
         captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data = parse_json(captured.out)
 
         assert "locations" in data
         # Should find references in sample_usage.py
@@ -208,17 +212,41 @@ class TestRefsCommandE2E:
         )
 
         captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data = parse_json(captured.out)
 
         assert "locations" in data
         locations = data["locations"]
         # May find references (Jedi behavior varies)
         # Just verify response structure is valid
-        assert isinstance(locations, list)
+        assert type(locations) is list
+
+    def test_refs_file_scope(self, e2e_workspace, temp_registry, capsys, monkeypatch):
+        """Test --scope file limits references to the given file (full E2E)."""
+        monkeypatch.setattr(sys, "argv", ["pyclide_client.py", "refs", "sample_module.py", "4", "5", "--scope", "file"])
+
+        handle_refs(
+            ["sample_module.py", "4", "5", "--scope", "file"],  # On "hello_world" definition
+            str(e2e_workspace)
+        )
+
+        captured = capsys.readouterr()
+        data = parse_json(captured.out)
+
+        assert len(data["locations"]) > 0
+        assert all(loc["file"].endswith("sample_module.py") for loc in data["locations"])
+
+    def test_refs_invalid_scope(self, e2e_workspace, temp_registry, monkeypatch):
+        """Test an unknown --scope value exits with error before contacting the server."""
+        monkeypatch.setattr(sys, "argv", ["pyclide_client.py", "refs", "sample_module.py", "4", "5", "--scope", "module"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            handle_refs(["sample_module.py", "4", "5", "--scope", "module"], str(e2e_workspace))
+
+        assert exc_info.value.code == 1
 
 
 @pytest.mark.e2e
-@pytest.mark.skipif(not shutil.which("uvx"), reason="uvx not available")
+@requires_uvx
 class TestHoverCommandE2E:
     """E2E tests for 'hover' command (symbol information)."""
 
@@ -230,7 +258,7 @@ class TestHoverCommandE2E:
         )
 
         captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data = parse_json(captured.out)
 
         # Should have signature or docstring
         assert "signature" in data or "docstring" in data
@@ -243,14 +271,14 @@ class TestHoverCommandE2E:
         )
 
         captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data = parse_json(captured.out)
 
         # Should have information about the method
         assert "signature" in data or "docstring" in data
 
 
 @pytest.mark.e2e
-@pytest.mark.skipif(not shutil.which("uvx"), reason="uvx not available")
+@requires_uvx
 class TestRenameCommandE2E:
     """E2E tests for 'rename' command (semantic rename)."""
 
@@ -262,12 +290,12 @@ class TestRenameCommandE2E:
         )
 
         captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data = parse_json(captured.out)
 
         # Should return patches
         assert "patches" in data
         patches = data["patches"]
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
         # Should modify sample_module.py
         assert any("sample_module.py" in path for path in patches.keys())
@@ -287,7 +315,7 @@ class TestRenameCommandE2E:
         )
 
         captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data = parse_json(captured.out)
 
         assert "patches" in data
         patches = data["patches"]
@@ -297,7 +325,7 @@ class TestRenameCommandE2E:
 
 
 @pytest.mark.e2e
-@pytest.mark.skipif(not shutil.which("uvx"), reason="uvx not available")
+@requires_uvx
 class TestOccurrencesCommandE2E:
     """E2E tests for 'occurrences' command (semantic occurrences)."""
 
@@ -309,7 +337,7 @@ class TestOccurrencesCommandE2E:
         )
 
         captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data = parse_json(captured.out)
 
         # Should return locations of all occurrences
         assert "locations" in data
@@ -325,17 +353,17 @@ class TestOccurrencesCommandE2E:
             )
 
             captured = capsys.readouterr()
-            data = json.loads(captured.out)
+            data = parse_json(captured.out)
 
             assert "locations" in data
-            assert isinstance(data["locations"], list)
+            assert type(data["locations"]) is list
         except (SystemExit, Exception):
             # Rope might fail on some patterns - acceptable in E2E
             pass
 
 
 @pytest.mark.e2e
-@pytest.mark.skipif(not shutil.which("uvx"), reason="uvx not available")
+@requires_uvx
 class TestServerLifecycleE2E:
     """E2E tests for server lifecycle management."""
 
@@ -411,7 +439,7 @@ class TestServerLifecycleE2E:
 
 
 @pytest.mark.e2e
-@pytest.mark.skipif(not shutil.which("uvx"), reason="uvx not available")
+@requires_uvx
 class TestExtractMethodCommandE2E:
     """E2E tests for 'extract-method' command."""
 
@@ -423,12 +451,12 @@ class TestExtractMethodCommandE2E:
         )
 
         captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data = parse_json(captured.out)
 
         # Should return patches
         assert "patches" in data
         patches = data["patches"]
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
         # Should modify sample_module.py
         if patches:  # Rope might return empty if extraction isn't valid
@@ -436,7 +464,7 @@ class TestExtractMethodCommandE2E:
 
 
 @pytest.mark.e2e
-@pytest.mark.skipif(not shutil.which("uvx"), reason="uvx not available")
+@requires_uvx
 class TestExtractVarCommandE2E:
     """E2E tests for 'extract-var' command."""
 
@@ -458,16 +486,16 @@ class TestExtractVarCommandE2E:
         )
 
         captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data = parse_json(captured.out)
 
         # Should return patches
         assert "patches" in data
         patches = data["patches"]
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
 
 @pytest.mark.e2e
-@pytest.mark.skipif(not shutil.which("uvx"), reason="uvx not available")
+@requires_uvx
 class TestMoveCommandE2E:
     """E2E tests for 'move' command."""
 
@@ -483,12 +511,12 @@ class TestMoveCommandE2E:
         )
 
         captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data = parse_json(captured.out)
 
         # Should return patches
         assert "patches" in data
         patches = data["patches"]
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
         # Should modify at least the source file
         if patches:
@@ -496,7 +524,7 @@ class TestMoveCommandE2E:
 
 
 @pytest.mark.e2e
-@pytest.mark.skipif(not shutil.which("uvx"), reason="uvx not available")
+@requires_uvx
 class TestOrganizeImportsCommandE2E:
     """E2E tests for 'organize-imports' command."""
 
@@ -523,9 +551,9 @@ def use_it():
         )
 
         captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data = parse_json(captured.out)
 
         # Should return patches
         assert "patches" in data
         patches = data["patches"]
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
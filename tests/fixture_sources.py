@@ -0,0 +1,36 @@
+"""Source snippets shared by several test modules.
+
+Stored pre-encoded so tests write them with Path.write_bytes(). Tests that
+also need the text (e.g. to apply a diff) use .decode(). Line numbers in the
+comments are 1-based, as sent to the server and RopeEngine; most snippets
+start with a blank line 1.
+"""
+
+# func() with "z = x + y" on line 5: the extract-method target
+EXTRACT_METHOD_SOURCE = b"""
+def func():
+    x = 10
+    y = 20
+    z = x + y
+    return z
+"""
+
+# func() with "10 + 20" at columns 14-21 of line 3: the extract-variable target
+EXTRACT_VARIABLE_SOURCE = b"""
+def func():
+    result = 10 + 20
+    return result
+"""
+
+# Minimal func() for invalid-range and invalid-name cases
+SIMPLE_FUNCTION_SOURCE = b"""
+def func():
+    x = 10
+    return x
+"""
+
+# usage.py importing old_name from module.py, for cross-file renames
+OLD_NAME_USAGE_SOURCE = b"from module import old_name\nold_name()\n"
+
+# A from-import for organize-imports convert_froms cases
+FROM_IMPORT_SOURCE = b"from os import path\nprint(path.exists('.'))\n"
@@ -6,7 +6,11 @@ from tests.utils import create_python_file
 
 @pytest.mark.integration
 class TestResponseContracts:
-    """Test that API response structures are stable."""
+    """Test that API response structures are stable.
+
+    Read-only endpoint checks share the session server; health and
+    organize-imports (which writes a file) get their own.
+    """
 
     def test_health_endpoint_contract(self, httpx_client):
         """Health endpoint must return stable structure."""
@@ -31,15 +35,16 @@ class TestResponseContracts:
         assert isinstance(data["cache_size"], int)
         assert isinstance(data["cache_invalidations"], int)
 
-    def test_defs_endpoint_contract(self, httpx_client, temp_workspace):
-        """Defs endpoint must return stable structure."""
-        response = httpx_client.post(
-            "/defs",
+    @pytest.mark.parametrize("endpoint", ["/defs", "/refs", "/occurrences"])
+    def test_locations_endpoint_contract(self, shared_client, shared_workspace, endpoint):
+        """Location endpoints must return stable structure."""
+        response = shared_client.post(
+            endpoint,
             json={
                 "file": "sample_module.py",
                 "line": 4,
                 "col": 5,
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -48,44 +53,22 @@ class TestResponseContracts:
 
         # Required structure
         assert "locations" in data
-        assert isinstance(data["locations"], list)
+        assert type(data["locations"]) is list
 
-        if len(data["locations"]) > 0:
-            loc = data["locations"][0]
-            assert "file" in loc
-            assert "line" in loc
-            assert "column" in loc
+        for loc in data["locations"]:
             assert isinstance(loc["file"], str)
             assert isinstance(loc["line"], int)
             assert isinstance(loc["column"], int)
 
-    def test_refs_endpoint_contract(self, httpx_client, temp_workspace):
-        """Refs endpoint must return stable structure."""
-        response = httpx_client.post(
-            "/refs",
-            json={
-                "file": "sample_module.py",
-                "line": 4,
-                "col": 5,
-                "root": str(temp_workspace)
-            }
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-
-        assert "locations" in data
-        assert isinstance(data["locations"], list)
-
-    def test_hover_endpoint_contract(self, httpx_client, temp_workspace):
+    def test_hover_endpoint_contract(self, shared_client, shared_workspace):
         """Hover endpoint must return stable structure."""
-        response = httpx_client.post(
+        response = shared_client.post(
             "/hover",
             json={
                 "file": "sample_module.py",
                 "line": 4,
                 "col": 5,
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -98,34 +81,16 @@ class TestResponseContracts:
         assert "signature" in data
         assert "docstring" in data
 
-    def test_occurrences_endpoint_contract(self, httpx_client, temp_workspace):
-        """Occurrences endpoint must return stable structure."""
-        response = httpx_client.post(
-            "/occurrences",
-            json={
-                "file": "sample_module.py",
-                "line": 4,
-                "col": 5,
-                "root": str(temp_workspace)
-            }
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-
-        assert "locations" in data
-        assert isinstance(data["locations"], list)
-
-    def test_rename_endpoint_contract(self, httpx_client, temp_workspace):
+    def test_rename_endpoint_contract(self, shared_client, shared_workspace):
         """Rename endpoint must return stable structure."""
-        response = httpx_client.post(
+        response = shared_client.post(
             "/rename",
             json={
                 "file": "sample_module.py",
                 "line": 14,
                 "col": 5,
                 "new_name": "msg",
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -134,7 +99,7 @@ class TestResponseContracts:
 
         # Patches structure
         assert "patches" in data
-        assert isinstance(data["patches"], dict)
+        assert type(data["patches"]) is dict
 
         # If patches exist, check structure
         if len(data["patches"]) > 0:
@@ -142,16 +107,16 @@ class TestResponseContracts:
                 assert isinstance(file_path, str)
                 assert isinstance(content, str)
 
-    def test_extract_method_endpoint_contract(self, httpx_client, temp_workspace):
+    def test_extract_method_endpoint_contract(self, shared_client, shared_workspace):
         """Extract method endpoint must return stable structure."""
-        response = httpx_client.post(
+        response = shared_client.post(
             "/extract-method",
             json={
                 "file": "sample_module.py",
                 "start_line": 14,
                 "end_line": 14,
                 "method_name": "helper",
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -159,11 +124,11 @@ class TestResponseContracts:
         data = response.json()
 
         assert "patches" in data
-        assert isinstance(data["patches"], dict)
+        assert type(data["patches"]) is dict
 
-    def test_extract_var_endpoint_contract(self, httpx_client, temp_workspace):
+    def test_extract_var_endpoint_contract(self, shared_client, shared_workspace):
         """Extract var endpoint must return stable structure."""
-        response = httpx_client.post(
+        response = shared_client.post(
             "/extract-var",
             json={
                 "file": "sample_module.py",
@@ -172,7 +137,7 @@ class TestResponseContracts:
                 "start_col": 16,
                 "end_col": 21,
                 "var_name": "temp",
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -180,7 +145,7 @@ class TestResponseContracts:
         data = response.json()
 
         assert "patches" in data
-        assert isinstance(data["patches"], dict)
+        assert type(data["patches"]) is dict
 
     def test_organize_imports_endpoint_contract(self, httpx_client, temp_workspace):
         """Organize imports endpoint must return stable structure."""
@@ -199,16 +164,16 @@ class TestResponseContracts:
         data = response.json()
 
         assert "patches" in data
-        assert isinstance(data["patches"], dict)
+        assert type(data["patches"]) is dict
 
 
 @pytest.mark.integration
 class TestErrorContracts:
     """Test that error responses are stable."""
 
-    def test_validation_error_contract(self, httpx_client):
+    def test_validation_error_contract(self, shared_client):
         """Validation errors must return 422 with detail."""
-        response = httpx_client.post(
+        response = shared_client.post(
             "/defs",
             json={
                 "file": "test.py",
@@ -223,29 +188,29 @@ class TestErrorContracts:
         # FastAPI validation error structure
         assert "detail" in data
 
-    def test_missing_file_error_contract(self, httpx_client, temp_workspace):
+    def test_missing_file_error_contract(self, shared_client, shared_workspace):
         """Missing file errors must return 4xx/5xx."""
-        response = httpx_client.post(
+        response = shared_client.post(
             "/defs",
             json={
                 "file": "nonexistent.py",
                 "line": 1,
                 "col": 1,
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
         assert response.status_code >= 400
 
-    def test_invalid_position_error_contract(self, httpx_client, temp_workspace):
+    def test_invalid_position_error_contract(self, shared_client, shared_workspace):
         """Invalid positions must return 4xx/5xx or empty results."""
-        response = httpx_client.post(
+        response = shared_client.post(
             "/occurrences",
             json={
                 "file": "sample_module.py",
                 "line": -1,
                 "col": -1,
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -261,10 +226,10 @@ class TestErrorContracts:
 class TestRequestValidation:
     """Test request validation contracts."""
 
-    def test_required_fields_enforced(self, httpx_client):
+    def test_required_fields_enforced(self, shared_client):
         """Required fields must be validated."""
         # Missing 'line'
-        response = httpx_client.post(
+        response = shared_client.post(
             "/defs",
             json={
                 "file": "test.py",
@@ -275,7 +240,7 @@ class TestRequestValidation:
         assert response.status_code == 422
 
         # Missing 'new_name' for rename
-        response = httpx_client.post(
+        response = shared_client.post(
             "/rename",
             json={
                 "file": "test.py",
@@ -286,30 +251,30 @@ class TestRequestValidation:
         )
         assert response.status_code == 422
 
-    def test_type_validation_enforced(self, httpx_client, temp_workspace):
+    def test_type_validation_enforced(self, shared_client, shared_workspace):
         """Field types must be validated."""
         # Line as string instead of int
-        response = httpx_client.post(
+        response = shared_client.post(
             "/defs",
             json={
                 "file": "test.py",
                 "line": "not_a_number",
                 "col": 1,
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
         assert response.status_code == 422
 
-    def test_optional_fields_handled(self, httpx_client, temp_workspace):
+    def test_optional_fields_handled(self, shared_client, shared_workspace):
         """Optional fields must work when omitted."""
         # Extract var without end_line (should default)
-        response = httpx_client.post(
+        response = shared_client.post(
             "/extract-var",
             json={
                 "file": "sample_module.py",
                 "start_line": 20,
                 "var_name": "temp",
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -321,28 +286,28 @@ class TestRequestValidation:
 class TestInteroperability:
     """Test that Rope and Jedi work together."""
 
-    def test_rope_and_jedi_same_file(self, httpx_client, temp_workspace):
+    def test_rope_and_jedi_same_file(self, shared_client, shared_workspace):
         """Rope and Jedi can both analyze same file."""
         # Jedi operation
-        jedi_response = httpx_client.post(
+        jedi_response = shared_client.post(
             "/defs",
             json={
                 "file": "sample_module.py",
                 "line": 4,
                 "col": 5,
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
         assert jedi_response.status_code == 200
 
         # Rope operation on same file
-        rope_response = httpx_client.post(
+        rope_response = shared_client.post(
             "/occurrences",
             json={
                 "file": "sample_module.py",
                 "line": 4,
                 "col": 5,
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
         assert rope_response.status_code == 200
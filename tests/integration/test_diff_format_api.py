@@ -8,6 +8,12 @@ import re
 
 import pytest
 
+from tests.fixture_sources import (
+    EXTRACT_METHOD_SOURCE,
+    EXTRACT_VARIABLE_SOURCE,
+    OLD_NAME_USAGE_SOURCE,
+)
+
 
 def apply_unified_diff(original_content: str, diff_text: str) -> str:
     """
@@ -145,14 +151,8 @@ def old_name():
     def test_api_extract_method_diff_applies_correctly(self, httpx_client, temp_workspace):
         """API extract method diff should apply correctly."""
         test_file = temp_workspace / "test.py"
-        original_content = """
-def func():
-    x = 10
-    y = 20
-    z = x + y
-    return z
-"""
-        test_file.write_text(original_content)
+        original_content = EXTRACT_METHOD_SOURCE.decode()
+        test_file.write_bytes(EXTRACT_METHOD_SOURCE)
 
         response_diff = httpx_client.post(
             "/extract-method",
@@ -190,12 +190,8 @@ def func():
     def test_api_extract_var_diff_applies_correctly(self, httpx_client, temp_workspace):
         """API extract variable diff should apply correctly."""
         test_file = temp_workspace / "test.py"
-        original_content = """
-def func():
-    result = 10 + 20
-    return result
-"""
-        test_file.write_text(original_content)
+        original_content = EXTRACT_VARIABLE_SOURCE.decode()
+        test_file.write_bytes(EXTRACT_VARIABLE_SOURCE)
 
         response_diff = httpx_client.post(
             "/extract-var",
@@ -286,8 +282,8 @@ print(json.dumps({}))
         file1.write_text(content1)
 
         file2 = temp_workspace / "usage.py"
-        content2 = "from module import old_name\nold_name()\n"
-        file2.write_text(content2)
+        content2 = OLD_NAME_USAGE_SOURCE.decode()
+        file2.write_bytes(OLD_NAME_USAGE_SOURCE)
 
         response_diff = httpx_client.post(
             "/rename",
@@ -429,13 +425,7 @@ class TestServerDiffFormat:
     def test_extract_method_returns_diff_by_default(self, httpx_client, temp_workspace):
         """Extract method returns diff by default."""
         test_file = temp_workspace / "test.py"
-        test_file.write_text("""
-def func():
-    x = 10
-    y = 20
-    z = x + y
-    return z
-""")
+        test_file.write_bytes(EXTRACT_METHOD_SOURCE)
 
         response = httpx_client.post(
             "/extract-method",
@@ -460,11 +450,7 @@ def func():
     def test_extract_var_returns_diff_by_default(self, httpx_client, temp_workspace):
         """Extract variable returns diff by default."""
         test_file = temp_workspace / "test.py"
-        test_file.write_text("""
-def func():
-    result = 10 + 20
-    return result
-""")
+        test_file.write_bytes(EXTRACT_VARIABLE_SOURCE)
 
         response = httpx_client.post(
             "/extract-var",
@@ -564,7 +550,7 @@ print(os.getcwd())
         # Required fields
         assert "patches" in data
         assert "format" in data
-        assert isinstance(data["patches"], dict)
+        assert type(data["patches"]) is dict
         assert data["format"] in ["diff", "full"]
 
     def test_diff_saves_tokens(self, httpx_client, temp_workspace):
@@ -339,7 +339,7 @@ class TestOperationFailures:
             data = response.json()
             patches = data.get("patches", {})
             # May return empty patches
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         else:
             assert response.status_code >= 400
 
@@ -413,7 +413,7 @@ class TestOperationFailures:
             data = response.json()
             patches = data.get("patches", {})
             # Should return empty patches (can't rename builtin)
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         else:
             assert response.status_code >= 400
 
@@ -48,54 +48,36 @@ obj.method()
         locations = data["locations"]
         assert len(locations) >= 1
 
-    def test_goto_on_import_statement(self, httpx_client, temp_workspace):
-        """Test goto on an import statement."""
-        import_file = temp_workspace / "imports.py"
-        create_python_file(import_file, "import os\n")
+    @pytest.mark.parametrize(
+        "filename,source,line,col",
+        [
+            pytest.param("imports.py", "import os\n", 1, 8, id="import_statement"),  # On "os"
+            pytest.param("builtin.py", "x = len([1, 2, 3])\n", 1, 5, id="builtin_function"),  # On "len"
+        ],
+    )
+    def test_goto_on_external_symbol(self, httpx_client, temp_workspace, filename, source, line, col):
+        """Test goto on stdlib/builtin symbols."""
+        create_python_file(temp_workspace / filename, source)
 
         response = httpx_client.post(
             "/defs",
             json={
-                "file": "imports.py",
-                "line": 1,
-                "col": 8,  # On "os"
+                "file": filename,
+                "line": line,
+                "col": col,
                 "root": str(temp_workspace)
             }
         )
 
-        # May go to os module definition or return empty
+        # May go to the stdlib/builtin definition or return empty
         if response.status_code == 200:
             data = response.json()
             locations = data.get("locations", [])
-            assert isinstance(locations, list)
+            assert type(locations) is list
         else:
             # May fail on builtins/stdlib
             assert response.status_code >= 400
 
-    def test_goto_on_builtin_function(self, httpx_client, temp_workspace):
-        """Test goto on builtin symbol."""
-        builtin_file = temp_workspace / "builtin.py"
-        create_python_file(builtin_file, "x = len([1, 2, 3])\n")
-
-        response = httpx_client.post(
-            "/defs",
-            json={
-                "file": "builtin.py",
-                "line": 1,
-                "col": 5,  # On "len"
-                "root": str(temp_workspace)
-            }
-        )
-
-        # May return empty or definition depending on Jedi config
-        if response.status_code == 200:
-            data = response.json()
-            locations = data.get("locations", [])
-            assert isinstance(locations, list)
-            # Builtins may not have location
-        else:
-            assert response.status_code >= 400
-
     def test_goto_on_undefined_symbol(self, httpx_client, temp_workspace):
         """Test goto on undefined symbol."""
         undefined_file = temp_workspace / "undefined.py"
@@ -121,60 +103,50 @@ obj.method()
             # May return error
             assert response.status_code >= 400
 
-    def test_goto_on_lambda_function(self, httpx_client, temp_workspace):
-        """Test goto on lambda function."""
-        lambda_file = temp_workspace / "lambda_test.py"
-        create_python_file(
-            lambda_file,
-            """
+    @pytest.mark.parametrize(
+        "filename,source,line,col",
+        [
+            pytest.param(
+                "lambda_test.py",
+                """
 add = lambda x, y: x + y
 result = add(1, 2)
-"""
-        )
-
-        response = httpx_client.post(
-            "/defs",
-            json={
-                "file": "lambda_test.py",
-                "line": 3,
-                "col": 10,  # On "add" in call
-                "root": str(temp_workspace)
-            }
-        )
-
-        if response.status_code == 200:
-            data = response.json()
-            # Should find the lambda definition
-            assert_locations_response(data, min_count=1)
-
-    def test_goto_on_decorator(self, httpx_client, temp_workspace):
-        """Test goto on decorator."""
-        decorator_file = temp_workspace / "decorator.py"
-        create_python_file(
-            decorator_file,
-            """
+""",
+                3, 10,  # On "add" in call
+                id="lambda_function",
+            ),
+            pytest.param(
+                "decorator.py",
+                """
 def my_decorator(func):
     return func
 
 @my_decorator
 def decorated_func():
     pass
-"""
-        )
+""",
+                5, 2,  # On "@my_decorator"
+                id="decorator",
+            ),
+        ],
+    )
+    def test_goto_on_local_callable(self, httpx_client, temp_workspace, filename, source, line, col):
+        """Test goto on locally defined callables (lambda, decorator)."""
+        create_python_file(temp_workspace / filename, source)
 
         response = httpx_client.post(
             "/defs",
             json={
-                "file": "decorator.py",
-                "line": 5,
-                "col": 2,  # On "@my_decorator"
+                "file": filename,
+                "line": line,
+                "col": col,
                 "root": str(temp_workspace)
             }
         )
 
         if response.status_code == 200:
             data = response.json()
-            # Should find the decorator definition
+            # Should find the local definition
             assert_locations_response(data, min_count=1)
 
 
@@ -297,12 +269,12 @@ def outer():
             # Should find definition and usage in nested scope
             assert_locations_response(data, min_count=2)
 
-    def test_references_class_attribute(self, httpx_client, temp_workspace):
-        """Test references to class attributes."""
-        class_file = temp_workspace / "class_attr.py"
-        create_python_file(
-            class_file,
-            """
+    @pytest.mark.parametrize(
+        "filename,source,line,col",
+        [
+            pytest.param(
+                "class_attr.py",
+                """
 class MyClass:
     class_var = 42
 
@@ -311,30 +283,13 @@ class MyClass:
 
 obj = MyClass()
 print(obj.class_var)
-"""
-        )
-
-        response = httpx_client.post(
-            "/refs",
-            json={
-                "file": "class_attr.py",
-                "line": 3,
-                "col": 5,  # On "class_var" definition
-                "root": str(temp_workspace)
-            }
-        )
-
-        if response.status_code == 200:
-            data = response.json()
-            # Should find definition and usages
-            assert_locations_response(data, min_count=1)
-
-    def test_references_method_calls_chain(self, httpx_client, temp_workspace):
-        """Test references for methods in call chains."""
-        chain_file = temp_workspace / "chain.py"
-        create_python_file(
-            chain_file,
-            """
+""",
+                3, 5,  # On "class_var" definition
+                id="class_attribute",
+            ),
+            pytest.param(
+                "chain.py",
+                """
 class Builder:
     def add(self, x):
         return self
@@ -343,20 +298,27 @@ class Builder:
         return "done"
 
 result = Builder().add(1).add(2).build()
-"""
-        )
+""",
+                3, 9,  # On "add" method definition
+                id="method_calls_chain",
+            ),
+        ],
+    )
+    def test_references_class_member(self, httpx_client, temp_workspace, filename, source, line, col):
+        """Test references to class members (attributes, chained methods)."""
+        create_python_file(temp_workspace / filename, source)
 
         response = httpx_client.post(
             "/refs",
             json={
-                "file": "chain.py",
-                "line": 3,
-                "col": 9,  # On "add" method definition
+                "file": filename,
+                "line": line,
+                "col": col,
                 "root": str(temp_workspace)
             }
         )
 
         if response.status_code == 200:
             data = response.json()
-            # Should find definition and calls in chain
+            # Should find definition and usages
             assert_locations_response(data, min_count=1)
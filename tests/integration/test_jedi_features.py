@@ -10,18 +10,21 @@ from tests.utils import assert_locations_response, get_relative_path
 
 @pytest.mark.jedi
 class TestJediFeatures:
-    """Test Jedi integration features via server API."""
+    """Test Jedi integration features via server API.
 
-    def test_jedi_goto_function_definition(self, httpx_client, temp_workspace):
+    All requests are read-only, so they share one session workspace and server.
+    """
+
+    def test_jedi_goto_function_definition(self, shared_client, shared_workspace):
         """Test goto for function definition via /defs endpoint."""
         # In sample_usage.py, line 9 has "hello_world" - should go to its definition
-        response = httpx_client.post(
+        response = shared_client.post(
             "/defs",
             json={
                 "file": "sample_usage.py",
                 "line": 9,
                 "col": 20,  # on "hello_world" in the function call
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -35,16 +38,16 @@ class TestJediFeatures:
         assert len(locations) > 0
         assert "sample_usage.py" in locations[0]["file"] or "sample_module.py" in locations[0]["file"]
 
-    def test_jedi_goto_class_definition(self, httpx_client, temp_workspace):
+    def test_jedi_goto_class_definition(self, shared_client, shared_workspace):
         """Test goto for class definition via /defs endpoint."""
         # Line 13, column 15 is on "Calculator" in the class instantiation
-        response = httpx_client.post(
+        response = shared_client.post(
             "/defs",
             json={
                 "file": "sample_usage.py",
                 "line": 13,
                 "col": 15,
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -56,16 +59,16 @@ class TestJediFeatures:
         locations = data["locations"]
         assert "sample_usage.py" in locations[0]["file"] or "sample_module.py" in locations[0]["file"]
 
-    def test_jedi_get_references(self, httpx_client, temp_workspace):
+    def test_jedi_get_references(self, shared_client, shared_workspace):
         """Test finding references to a function via /refs endpoint."""
         # Line 4, column 5 is on the "hello_world" function definition
-        response = httpx_client.post(
+        response = shared_client.post(
             "/refs",
             json={
                 "file": "sample_module.py",
                 "line": 4,
                 "col": 5,
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -75,20 +78,52 @@ class TestJediFeatures:
 
         # Should include both definition and usage
         locations = data["locations"]
-        paths = [loc["file"] for loc in locations]
-        assert any("sample_module.py" in p for p in paths)
-        assert any("sample_usage.py" in p for p in paths)
+        assert any("sample_module.py" in loc["file"] for loc in locations)
+        assert any("sample_usage.py" in loc["file"] for loc in locations)
+
+    def test_jedi_get_references_file_scope(self, shared_client, shared_workspace):
+        """Test /refs with scope="file" only searches the requested file."""
+        response = shared_client.post(
+            "/refs",
+            json={
+                "file": "sample_module.py",
+                "line": 4,
+                "col": 5,
+                "root": str(shared_workspace),
+                "scope": "file"
+            }
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert_locations_response(data, min_count=1)
+        assert all(loc["file"].endswith("sample_module.py") for loc in data["locations"])
+
+    def test_jedi_get_references_invalid_scope(self, shared_client, shared_workspace):
+        """Test /refs rejects an unknown scope with a validation error."""
+        response = shared_client.post(
+            "/refs",
+            json={
+                "file": "sample_module.py",
+                "line": 4,
+                "col": 5,
+                "root": str(shared_workspace),
+                "scope": "module"
+            }
+        )
+
+        assert response.status_code == 422
 
-    def test_jedi_hover_function(self, httpx_client, temp_workspace):
+    def test_jedi_hover_function(self, shared_client, shared_workspace):
         """Test hover information for a function via /hover endpoint."""
         # Line 4, column 5 is on "hello_world"
-        response = httpx_client.post(
+        response = shared_client.post(
             "/hover",
             json={
                 "file": "sample_module.py",
                 "line": 4,
                 "col": 5,
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -101,18 +136,18 @@ class TestJediFeatures:
 
         # Check docstring is available
         assert data["docstring"] is not None
-        assert "greeting message" in data["docstring"].lower()
+        assert "Returns a greeting message." in data["docstring"]
 
-    def test_jedi_hover_class_method(self, httpx_client, temp_workspace):
+    def test_jedi_hover_class_method(self, shared_client, shared_workspace):
         """Test hover information for a class method via /hover endpoint."""
         # Line 30, column 9 is on "add" method
-        response = httpx_client.post(
+        response = shared_client.post(
             "/hover",
             json={
                 "file": "sample_module.py",
                 "line": 30,
                 "col": 9,
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -3,21 +3,13 @@
 Tests from test_integration.py that add unique coverage not found in other files.
 """
 
+import re
+
 import pytest
 from tests.utils import create_python_file, assert_patches_valid
 
-
-@pytest.mark.integration
-@pytest.mark.rope
-class TestStarImports:
-    """Test refactoring with star imports."""
-
-    @pytest.fixture
-    def star_import_project(self, temp_workspace):
-        """Create project with star imports."""
-        create_python_file(
-            temp_workspace / "shapes.py",
-            """
+# Fixture sources, pre-encoded once at import time
+_SHAPES_PY = b"""
 class Shape:
     def area(self):
         pass
@@ -37,11 +29,8 @@ class Circle(Shape):
     def area(self):
         return 3.14 * self.radius ** 2
 """
-        )
 
-        create_python_file(
-            temp_workspace / "star_import.py",
-            """
+_STAR_IMPORT_PY = b"""
 from shapes import *
 
 def create_shapes():
@@ -49,9 +38,41 @@ def create_shapes():
     circ = Circle(5)
     return rect, circ
 """
-        )
 
-        return temp_workspace
+_CALCULATOR_PY = b"""
+class Calculator:
+    def calculate(self, a, b):
+        sum_value = a + b
+        result = sum_value * 2
+        return result
+
+def use_calculator():
+    calc = Calculator()
+    value = calc.calculate(10, 20)
+    return value
+"""
+
+# Classifies the rename markers in calculator.py in a single pass
+_RENAME_MARKERS = re.compile(r"(?P<new_def>def compute\b)|(?P<new_call>calc\.compute\b)|(?P<old_def>def calculate\b)")
+
+
+@pytest.fixture
+def shapes_project(temp_workspace):
+    """Workspace with the shapes.py class hierarchy."""
+    create_python_file(temp_workspace / "shapes.py", _SHAPES_PY)
+    return temp_workspace
+
+
+@pytest.mark.integration
+@pytest.mark.rope
+class TestStarImports:
+    """Test refactoring with star imports."""
+
+    @pytest.fixture
+    def star_import_project(self, shapes_project):
+        """Create project with star imports."""
+        create_python_file(shapes_project / "star_import.py", _STAR_IMPORT_PY)
+        return shapes_project
 
     def test_rename_with_star_imports(self, httpx_client, star_import_project):
         """Test rename with star imports."""
@@ -122,36 +143,7 @@ def outer():
 class TestInheritanceRefactoring:
     """Test refactoring with inheritance."""
 
-    @pytest.fixture
-    def inheritance_project(self, temp_workspace):
-        """Create project with inheritance."""
-        create_python_file(
-            temp_workspace / "shapes.py",
-            """
-class Shape:
-    def area(self):
-        pass
-
-class Rectangle(Shape):
-    def __init__(self, width, height):
-        self.width = width
-        self.height = height
-
-    def area(self):
-        return self.width * self.height
-
-class Circle(Shape):
-    def __init__(self, radius):
-        self.radius = radius
-
-    def area(self):
-        return 3.14 * self.radius ** 2
-"""
-        )
-
-        return temp_workspace
-
-    def test_rename_method_with_inheritance(self, httpx_client, inheritance_project):
+    def test_rename_method_with_inheritance(self, httpx_client, shapes_project):
         """Test renaming a method used via inheritance."""
         response = httpx_client.post(
             "/rename",
@@ -160,7 +152,7 @@ class Circle(Shape):
                 "line": 3,
                 "col": 9,
                 "new_name": "calculate_area",
-                "root": str(inheritance_project)
+                "root": str(shapes_project)
             }
         )
 
@@ -182,21 +174,7 @@ class TestMultistepWorkflows:
     @pytest.fixture
     def workflow_project(self, temp_workspace):
         """Create project for workflow tests."""
-        create_python_file(
-            temp_workspace / "calculator.py",
-            """
-class Calculator:
-    def calculate(self, a, b):
-        sum_value = a + b
-        result = sum_value * 2
-        return result
-
-def use_calculator():
-    calc = Calculator()
-    value = calc.calculate(10, 20)
-    return value
-"""
-        )
+        create_python_file(temp_workspace / "calculator.py", _CALCULATOR_PY)
 
         return temp_workspace
 
@@ -223,11 +201,13 @@ def use_calculator():
         assert "calculator.py" in patches
         content = patches["calculator.py"]
 
+        found = {match.lastgroup for match in _RENAME_MARKERS.finditer(content)}
+
         # Both definition and usage should be renamed
-        assert "def compute" in content
-        assert "calc.compute" in content
+        assert "new_def" in found
+        assert "new_call" in found
         # Old name should not appear in method context
-        assert "def calculate" not in content
+        assert "old_def" not in found
 
     def test_extract_method_then_verify_structure(self, httpx_client, workflow_project):
         """Test: extract method → verify extracted method appears."""
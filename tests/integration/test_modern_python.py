@@ -2,83 +2,179 @@
 
 import sys
 import pytest
-from tests.utils import create_python_file, assert_patches_valid
+from tests.utils import create_python_files, assert_patches_valid
 
 
-@pytest.mark.integration
-@pytest.mark.skipif(sys.version_info < (3, 10), reason="Requires Python 3.10+")
-class TestModernTyping:
-    """Tests for modern type hints."""
+requires_py310 = pytest.mark.skipif(sys.version_info < (3, 10), reason="Requires Python 3.10+")
+
 
-    def test_goto_on_modern_generics(self, httpx_client, temp_workspace):
-        """Test goto with Python 3.10+ generics syntax."""
-        test_file = temp_workspace / "generics.py"
-        create_python_file(
-            test_file,
-            """
+# One pre-encoded source file per test. Every request below is read-only
+# (rename only computes patches), so the files are written once per module
+# and served by a single server instead of a fresh workspace per test.
+_SOURCES = {
+    "generics.py": b"""
 def process(items: list[str]) -> dict[str, int]:
     return {item: len(item) for item in items}
 
 result = process(["a", "b"])
-"""
-        )
+""",
+    "unions.py": b"""
+def func(x: int | str) -> int | None:
+    return len(x) if isinstance(x, str) else x
+""",
+    "protocol.py": b"""
+from typing import Protocol
 
-        response = httpx_client.post(
-            "/defs",
-            json={
-                "file": "generics.py",
-                "line": 5,
-                "col": 10,
-                "root": str(temp_workspace)
-            }
-        )
+class Drawable(Protocol):
+    def draw(self) -> None: ...
+""",
+    "match_test.py": b"""
+def handle(value):
+    match value:
+        case 1:
+            return "one"
+        case _:
+            return "other"
+""",
+    "pattern.py": b"""
+def process(point):
+    match point:
+        case (x, y):
+            return x + y
+""",
+    "dataclass_test.py": b"""
+from dataclasses import dataclass
 
-        assert response.status_code == 200
+@dataclass
+class Point:
+    x: int
+    y: int
 
-    def test_references_with_union_operator(self, httpx_client, temp_workspace):
-        """Test references with | union operator."""
-        test_file = temp_workspace / "unions.py"
-        create_python_file(
-            test_file,
-            """
-def func(x: int | str) -> int | None:
-    return len(x) if isinstance(x, str) else x
-"""
-        )
+p = Point(1, 2)
+print(p.x)
+""",
+    "dataclass_method.py": b"""
+from dataclasses import dataclass
+
+@dataclass
+class Data:
+    value: int
+
+    def process(self):
+        return self.value * 2
+""",
+    "dataclass_field.py": b"""
+from dataclasses import dataclass
+
+@dataclass
+class Config:
+    timeout: int
+
+c = Config(30)
+print(c.timeout)
+""",
+    "async_test.py": b"""
+async def fetch_data():
+    return "data"
 
-        response = httpx_client.post(
-            "/refs",
+async def main():
+    result = await fetch_data()
+""",
+    "async_rename.py": b"""
+async def load():
+    return 42
+
+async def process():
+    data = await load()
+""",
+    "await_refs.py": b"""
+async def helper():
+    return "help"
+
+async def main():
+    result = await helper()
+""",
+    "walrus.py": b"""
+if (n := len([1, 2, 3])) > 2:
+    print(n)
+""",
+    "walrus_rename.py": b"""
+if (count := len([1, 2])) > 1:
+    print(count)
+""",
+    "fstring.py": b"""
+name = "Alice"
+message = f"Hello {name}"
+""",
+    "fstring_rename.py": b"""
+value = 42
+text = f"The value is {value}"
+""",
+}
+
+
+@pytest.fixture(scope="module")
+def modern_workspace(tmp_path_factory):
+    """Module-wide workspace holding every snippet in _SOURCES."""
+    return create_python_files(tmp_path_factory.mktemp("modern_python"), _SOURCES)
+
+
+@pytest.fixture(scope="module")
+def modern_client(modern_workspace, server_factory):
+    """TestClient for a server on modern_workspace, reused across the module."""
+    return server_factory(modern_workspace)
+
+
+@pytest.mark.integration
+class TestModernSyntaxNavigation:
+    """Navigation requests on modern syntax must succeed.
+
+    One parametrized test so all cases run against the same warm server.
+    """
+
+    # Reference cases only look at their own snippet, so they search just that file
+    @pytest.mark.parametrize("endpoint,file,line,col,extra", [
+        pytest.param("/defs", "generics.py", 5, 10, {}, id="goto_on_modern_generics", marks=requires_py310),
+        pytest.param("/refs", "unions.py", 2, 5, {"scope": "file"}, id="references_with_union_operator", marks=requires_py310),
+        pytest.param("/defs", "match_test.py", 2, 5, {}, id="goto_in_match_statement", marks=requires_py310),
+        pytest.param("/defs", "dataclass_test.py", 10, 9, {}, id="goto_dataclass_field"),
+        pytest.param("/occurrences", "dataclass_field.py", 6, 5, {}, id="occurrences_dataclass_field"),
+        pytest.param("/defs", "async_test.py", 6, 19, {}, id="goto_async_function"),
+        pytest.param("/refs", "await_refs.py", 2, 11, {"scope": "file"}, id="references_await_expression"),
+        pytest.param("/defs", "walrus.py", 3, 11, {}, id="goto_walrus_variable", marks=requires_py310),
+        pytest.param("/defs", "fstring.py", 3, 20, {}, id="goto_in_fstring"),
+    ])
+    def test_navigation_request_succeeds(self, modern_client, modern_workspace, endpoint, file, line, col, extra):
+        """Goto, references and occurrences work on the snippet position."""
+        response = modern_client.post(
+            endpoint,
             json={
-                "file": "unions.py",
-                "line": 2,
-                "col": 5,
-                "root": str(temp_workspace)
+                "file": file,
+                "line": line,
+                "col": col,
+                "root": str(modern_workspace),
+                **extra
             }
         )
 
         assert response.status_code == 200
 
-    def test_rename_with_protocol(self, httpx_client, temp_workspace):
-        """Test rename with Protocol."""
-        test_file = temp_workspace / "protocol.py"
-        create_python_file(
-            test_file,
-            """
-from typing import Protocol
 
-class Drawable(Protocol):
-    def draw(self) -> None: ...
-"""
-        )
+@pytest.mark.integration
+@requires_py310
+class TestModernTyping:
+    """Tests for modern type hints."""
 
-        response = httpx_client.post(
+    def test_rename_with_protocol(self, modern_client, modern_workspace):
+        """Test rename with Protocol."""
+        response = modern_client.post(
             "/rename",
             json={
                 "file": "protocol.py",
                 "line": 4,
                 "col": 7,
                 "new_name": "Renderable",
-                "root": str(temp_workspace)
+                "root": str(modern_workspace)
             }
         )
 
@@ -89,58 +185,20 @@ class Drawable(Protocol):
 
 
 @pytest.mark.integration
-@pytest.mark.skipif(sys.version_info < (3, 10), reason="Requires Python 3.10+")
+@requires_py310
 class TestPatternMatching:
     """Tests for match/case statements."""
 
-    def test_goto_in_match_statement(self, httpx_client, temp_workspace):
-        """Test goto within match statement."""
-        test_file = temp_workspace / "match_test.py"
-        create_python_file(
-            test_file,
-            """
-def handle(value):
-    match value:
-        case 1:
-            return "one"
-        case _:
-            return "other"
-"""
-        )
-
-        response = httpx_client.post(
-            "/defs",
-            json={
-                "file": "match_test.py",
-                "line": 2,
-                "col": 5,
-                "root": str(temp_workspace)
-            }
-        )
-
-        assert response.status_code == 200
-
-    def test_rename_variable_in_pattern(self, httpx_client, temp_workspace):
+    def test_rename_variable_in_pattern(self, modern_client, modern_workspace):
         """Test rename variable used in pattern."""
-        test_file = temp_workspace / "pattern.py"
-        create_python_file(
-            test_file,
-            """
-def process(point):
-    match point:
-        case (x, y):
-            return x + y
-"""
-        )
-
-        response = httpx_client.post(
+        response = modern_client.post(
             "/rename",
             json={
                 "file": "pattern.py",
                 "line": 4,
                 "col": 15,
                 "new_name": "a",
-                "root": str(temp_workspace)
+                "root": str(modern_workspace)
             }
         )
 
@@ -152,61 +210,16 @@ def process(point):
 class TestDataclasses:
     """Tests for dataclass features."""
 
-    def test_goto_dataclass_field(self, httpx_client, temp_workspace):
-        """Test goto on dataclass field."""
-        test_file = temp_workspace / "dataclass_test.py"
-        create_python_file(
-            test_file,
-            """
-from dataclasses import dataclass
-
-@dataclass
-class Point:
-    x: int
-    y: int
-
-p = Point(1, 2)
-print(p.x)
-"""
-        )
-
-        response = httpx_client.post(
-            "/defs",
-            json={
-                "file": "dataclass_test.py",
-                "line": 10,
-                "col": 9,
-                "root": str(temp_workspace)
-            }
-        )
-
-        assert response.status_code == 200
-
-    def test_rename_dataclass_method(self, httpx_client, temp_workspace):
+    def test_rename_dataclass_method(self, modern_client, modern_workspace):
         """Test rename dataclass method."""
-        test_file = temp_workspace / "dataclass_method.py"
-        create_python_file(
-            test_file,
-            """
-from dataclasses import dataclass
-
-@dataclass
-class Data:
-    value: int
-
-    def process(self):
-        return self.value * 2
-"""
-        )
-
-        response = httpx_client.post(
+        response = modern_client.post(
             "/rename",
             json={
                 "file": "dataclass_method.py",
                 "line": 8,
                 "col": 9,
                 "new_name": "compute",
-                "root": str(temp_workspace)
+                "root": str(modern_workspace)
             }
         )
 
@@ -215,88 +228,21 @@ class Data:
             patches = data["patches"]
             assert_patches_valid(patches)
 
-    def test_occurrences_dataclass_field(self, httpx_client, temp_workspace):
-        """Test occurrences of dataclass field."""
-        test_file = temp_workspace / "dataclass_field.py"
-        create_python_file(
-            test_file,
-            """
-from dataclasses import dataclass
-
-@dataclass
-class Config:
-    timeout: int
-
-c = Config(30)
-print(c.timeout)
-"""
-        )
-
-        response = httpx_client.post(
-            "/occurrences",
-            json={
-                "file": "dataclass_field.py",
-                "line": 6,
-                "col": 5,
-                "root": str(temp_workspace)
-            }
-        )
-
-        assert response.status_code == 200
-
 
 @pytest.mark.integration
 class TestAsyncAwait:
     """Tests for async/await syntax."""
 
-    def test_goto_async_function(self, httpx_client, temp_workspace):
-        """Test goto on async function."""
-        test_file = temp_workspace / "async_test.py"
-        create_python_file(
-            test_file,
-            """
-async def fetch_data():
-    return "data"
-
-async def main():
-    result = await fetch_data()
-"""
-        )
-
-        response = httpx_client.post(
-            "/defs",
-            json={
-                "file": "async_test.py",
-                "line": 6,
-                "col": 19,
-                "root": str(temp_workspace)
-            }
-        )
-
-        assert response.status_code == 200
-
-    def test_rename_async_function(self, httpx_client, temp_workspace):
+    def test_rename_async_function(self, modern_client, modern_workspace):
         """Test rename async function."""
-        test_file = temp_workspace / "async_rename.py"
-        create_python_file(
-            test_file,
-            """
-async def load():
-    return 42
-
-async def process():
-    data = await load()
-"""
-        )
-
-        response = httpx_client.post(
+        response = modern_client.post(
             "/rename",
             json={
                 "file": "async_rename.py",
                 "line": 2,
                 "col": 11,
                 "new_name": "fetch",
-                "root": str(temp_workspace)
+                "root": str(modern_workspace)
             }
         )
 
@@ -305,80 +251,22 @@ async def process():
             patches = data["patches"]
             assert_patches_valid(patches)
 
-    def test_references_await_expression(self, httpx_client, temp_workspace):
-        """Test references in await expression."""
-        test_file = temp_workspace / "await_refs.py"
-        create_python_file(
-            test_file,
-            """
-async def helper():
-    return "help"
-
-async def main():
-    result = await helper()
-"""
-        )
-
-        response = httpx_client.post(
-            "/refs",
-            json={
-                "file": "await_refs.py",
-                "line": 2,
-                "col": 11,
-                "root": str(temp_workspace)
-            }
-        )
-
-        assert response.status_code == 200
-
 
 @pytest.mark.integration
-@pytest.mark.skipif(sys.version_info < (3, 10), reason="Requires Python 3.10+")
+@requires_py310
 class TestWalrusOperator:
     """Tests for walrus operator :=."""
 
-    def test_goto_walrus_variable(self, httpx_client, temp_workspace):
-        """Test goto on walrus operator variable."""
-        test_file = temp_workspace / "walrus.py"
-        create_python_file(
-            test_file,
-            """
-if (n := len([1, 2, 3])) > 2:
-    print(n)
-"""
-        )
-
-        response = httpx_client.post(
-            "/defs",
-            json={
-                "file": "walrus.py",
-                "line": 3,
-                "col": 11,
-                "root": str(temp_workspace)
-            }
-        )
-
-        assert response.status_code == 200
-
-    def test_rename_walrus_variable(self, httpx_client, temp_workspace):
+    def test_rename_walrus_variable(self, modern_client, modern_workspace):
         """Test rename walrus operator variable."""
-        test_file = temp_workspace / "walrus_rename.py"
-        create_python_file(
-            test_file,
-            """
-if (count := len([1, 2])) > 1:
-    print(count)
-"""
-        )
-
-        response = httpx_client.post(
+        response = modern_client.post(
             "/rename",
             json={
                 "file": "walrus_rename.py",
                 "line": 2,
                 "col": 5,
                 "new_name": "size",
-                "root": str(temp_workspace)
+                "root": str(modern_workspace)
             }
         )
 
@@ -390,48 +278,16 @@ if (count := len([1, 2])) > 1:
 class TestModernStringFeatures:
     """Tests for f-strings and modern string features."""
 
-    def test_goto_in_fstring(self, httpx_client, temp_workspace):
-        """Test goto on variable in f-string."""
-        test_file = temp_workspace / "fstring.py"
-        create_python_file(
-            test_file,
-            """
-name = "Alice"
-message = f"Hello {name}"
-"""
-        )
-
-        response = httpx_client.post(
-            "/defs",
-            json={
-                "file": "fstring.py",
-                "line": 3,
-                "col": 20,
-                "root": str(temp_workspace)
-            }
-        )
-
-        assert response.status_code == 200
-
-    def test_rename_var_used_in_fstring(self, httpx_client, temp_workspace):
+    def test_rename_var_used_in_fstring(self, modern_client, modern_workspace):
         """Test rename variable used in f-string."""
-        test_file = temp_workspace / "fstring_rename.py"
-        create_python_file(
-            test_file,
-            """
-value = 42
-text = f"The value is {value}"
-"""
-        )
-
-        response = httpx_client.post(
+        response = modern_client.post(
             "/rename",
             json={
                 "file": "fstring_rename.py",
                 "line": 2,
                 "col": 1,
                 "new_name": "number",
-                "root": str(temp_workspace)
+                "root": str(modern_workspace)
             }
         )
 
@@ -5,7 +5,7 @@ to ensure the server works with real codebases.
 """
 
 import pytest
-from tests.utils import create_python_file, assert_patches_valid, assert_locations_response
+from tests.utils import create_python_files, assert_patches_valid, assert_locations_response
 
 
 @pytest.mark.integration
@@ -16,10 +16,9 @@ class TestDjangoLikePatterns:
     @pytest.fixture
     def django_app(self, temp_workspace):
         """Create Django-like app structure."""
-        # models.py with Django ORM pattern
-        create_python_file(
-            temp_workspace / "models.py",
-            """
+        files = {
+            # models.py with Django ORM pattern
+            "models.py": """
 from typing import Optional
 
 class Model:
@@ -55,13 +54,10 @@ class Post(Model):
 
     def save(self):
         pass
-"""
-        )
+""",
 
-        # views.py with Django view pattern
-        create_python_file(
-            temp_workspace / "views.py",
-            """
+            # views.py with Django view pattern
+            "views.py": """
 from models import User, Post
 
 def user_detail(request, username: str):
@@ -77,13 +73,10 @@ def create_post(request):
     post = Post(title=request.get("title"), author=user)
     post.save()
     return {"post": post}
-"""
-        )
+""",
 
-        # admin.py with Django admin pattern
-        create_python_file(
-            temp_workspace / "admin.py",
-            """
+            # admin.py with Django admin pattern
+            "admin.py": """
 from models import User, Post
 
 class UserAdmin:
@@ -94,10 +87,10 @@ class UserAdmin:
 
 class PostAdmin:
     list_display = ['title', 'author']
-"""
-        )
+""",
+        }
 
-        return temp_workspace
+        return create_python_files(temp_workspace, files)
 
     def test_rename_model_class(self, httpx_client, django_app):
         """Test renaming a model class used across app."""
@@ -157,10 +150,9 @@ class TestFlaskLikePatterns:
     @pytest.fixture
     def flask_app(self, temp_workspace):
         """Create Flask-like app structure."""
-        # app.py with Flask patterns
-        create_python_file(
-            temp_workspace / "app.py",
-            """
+        files = {
+            # app.py with Flask patterns
+            "app.py": """
 from typing import Dict, Any
 
 class Request:
@@ -192,13 +184,9 @@ def fetch_user(user_id: int) -> Dict[str, Any]:
 
 def save_user(data: Dict[str, Any]) -> Dict[str, Any]:
     return data
-"""
-        )
+""",
 
-        # blueprints.py
-        create_python_file(
-            temp_workspace / "blueprints.py",
-            """
+            "blueprints.py": """
 from app import get_user, create_user, jsonify
 
 class Blueprint:
@@ -222,10 +210,10 @@ def user_detail(user_id: int):
 @user_bp.route("/users", methods=["POST"])
 def user_create(request):
     return create_user(request)
-"""
-        )
+""",
+        }
 
-        return temp_workspace
+        return create_python_files(temp_workspace, files)
 
     def test_rename_route_function(self, httpx_client, flask_app):
         """Test renaming a route function."""
@@ -277,10 +265,9 @@ class TestFastAPILikePatterns:
     @pytest.fixture
     def fastapi_app(self, temp_workspace):
         """Create FastAPI-like app structure."""
-        # schemas.py with Pydantic-like models
-        create_python_file(
-            temp_workspace / "schemas.py",
-            """
+        files = {
+            # schemas.py with Pydantic-like models
+            "schemas.py": """
 from typing import Optional
 
 class BaseModel:
@@ -299,13 +286,10 @@ class UserResponse(BaseModel):
 class UserUpdate(BaseModel):
     username: Optional[str] = None
     email: Optional[str] = None
-"""
-        )
+""",
 
-        # routes.py with FastAPI route patterns
-        create_python_file(
-            temp_workspace / "routes.py",
-            """
+            # routes.py with FastAPI route patterns
+            "routes.py": """
 from schemas import UserCreate, UserResponse, UserUpdate
 from typing import List
 
@@ -340,13 +324,9 @@ async def list_users() -> List[UserResponse]:
         UserResponse(id=1, username="user1", email="user1@example.com"),
         UserResponse(id=2, username="user2", email="user2@example.com"),
     ]
-"""
-        )
+""",
 
-        # dependencies.py
-        create_python_file(
-            temp_workspace / "dependencies.py",
-            """
+            "dependencies.py": """
 from schemas import UserResponse
 
 async def get_current_user() -> UserResponse:
@@ -357,10 +337,10 @@ async def require_admin() -> bool:
     \"\"\"Require admin permission.\"\"\"
     user = await get_current_user()
     return user.id == 1
-"""
-        )
+""",
+        }
 
-        return temp_workspace
+        return create_python_files(temp_workspace, files)
 
     def test_rename_schema_class(self, httpx_client, fastapi_app):
         """Test renaming Pydantic schema affects all usages."""
@@ -414,10 +394,8 @@ class TestDataSciencePatterns:
     @pytest.fixture
     def ml_project(self, temp_workspace):
         """Create ML project structure."""
-        # data_processing.py
-        create_python_file(
-            temp_workspace / "data_processing.py",
-            """
+        files = {
+            "data_processing.py": """
 import sys
 from typing import List, Tuple
 
@@ -441,13 +419,9 @@ def split_dataset(df: DataFrame, ratio: float = 0.8) -> Tuple[DataFrame, DataFra
 def feature_engineering(df: DataFrame) -> DataFrame:
     \"\"\"Extract features.\"\"\"
     return df
-"""
-        )
+""",
 
-        # model.py
-        create_python_file(
-            temp_workspace / "model.py",
-            """
+            "model.py": """
 from data_processing import DataFrame
 from typing import Any
 
@@ -472,13 +446,9 @@ class RandomForestModel(Model):
 
 class NeuralNetworkModel(Model):
     pass
-"""
-        )
+""",
 
-        # pipeline.py
-        create_python_file(
-            temp_workspace / "pipeline.py",
-            """
+            "pipeline.py": """
 from data_processing import load_dataset, preprocess_data, split_dataset
 from model import Model, RandomForestModel
 
@@ -502,10 +472,10 @@ def train_pipeline(data_path: str) -> Model:
     print(f"Accuracy: {accuracy}")
 
     return model
-"""
-        )
+""",
+        }
 
-        return temp_workspace
+        return create_python_files(temp_workspace, files)
 
     def test_rename_dataframe_type(self, httpx_client, ml_project):
         """Test renaming custom DataFrame class."""
@@ -560,13 +530,8 @@ class TestMicroservicePatterns:
     @pytest.fixture
     def microservice(self, temp_workspace):
         """Create microservice structure."""
-        # api/client.py
-        api_dir = temp_workspace / "api"
-        api_dir.mkdir()
-
-        create_python_file(
-            api_dir / "client.py",
-            """
+        files = {
+            "api/client.py": """
 from typing import Dict, Any, Optional
 
 class APIClient:
@@ -587,16 +552,9 @@ class UserServiceClient(APIClient):
 
     def create_user(self, data: Dict[str, Any]) -> Dict[str, Any]:
         return self.post("/users", data)
-"""
-        )
+""",
 
-        # services/user_service.py
-        services_dir = temp_workspace / "services"
-        services_dir.mkdir()
-
-        create_python_file(
-            services_dir / "user_service.py",
-            """
+            "services/user_service.py": """
 import sys
 sys.path.insert(0, '..')
 from api.client import UserServiceClient
@@ -612,10 +570,10 @@ class UserService:
     def register_user(self, username: str, email: str) -> Dict[str, Any]:
         data = {"username": username, "email": email}
         return self.client.create_user(data)
-"""
-        )
+""",
+        }
 
-        return temp_workspace
+        return create_python_files(temp_workspace, files)
 
     def test_rename_api_client_method(self, httpx_client, microservice):
         """Test renaming API client method (line 17, col 9)."""
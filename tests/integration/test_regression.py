@@ -156,8 +156,7 @@ def important_function():
         patches = data["patches"]
 
         # All files should be updated
-        all_content = " ".join(patches.values())
-        assert "critical_function" in all_content
+        assert any("critical_function" in content for content in patches.values())
 
     def test_organize_imports_preserves_needed_imports(self, httpx_client, temp_workspace):
         """CRITICAL: Used imports must not be removed."""
@@ -223,8 +222,7 @@ class TestCriticalMultiFileConsistency:
 
         # All files should get patches
         assert len(patches) >= 1
-        all_content = " ".join(patches.values())
-        assert "common_utility" in all_content
+        assert any("common_utility" in content for content in patches.values())
 
 
 @pytest.mark.integration
@@ -415,7 +413,7 @@ class TestCriticalResponseStructure:
 
         # Structure must be stable
         assert "patches" in data
-        assert isinstance(data["patches"], dict)
+        assert type(data["patches"]) is dict
 
     def test_locations_structure_is_stable(self, httpx_client, temp_workspace):
         """CRITICAL: Locations response structure must be stable."""
@@ -434,7 +432,7 @@ class TestCriticalResponseStructure:
 
         # Structure must be stable
         assert "locations" in data
-        assert isinstance(data["locations"], list)
+        assert type(data["locations"]) is list
         if len(data["locations"]) > 0:
             loc = data["locations"][0]
             assert "file" in loc
@@ -9,19 +9,24 @@ from tests.utils import assert_locations_response, assert_patches_valid, create_
 
 @pytest.mark.rope
 class TestRopeFeatures:
-    """Test Rope integration features via server API."""
+    """Test Rope integration features via server API.
 
-    def test_rope_occurrences_function(self, httpx_client, temp_workspace):
+    Rope only computes patches and never writes them, so every test except
+    organize-imports (which creates its own file) shares the session
+    workspace and server.
+    """
+
+    def test_rope_occurrences_function(self, shared_client, shared_workspace):
         """Test finding occurrences of a function name via /occurrences endpoint."""
         # Find occurrences of "hello_world" function
         # Line 4, column 5 is on the function definition
-        response = httpx_client.post(
+        response = shared_client.post(
             "/occurrences",
             json={
                 "file": "sample_module.py",
                 "line": 4,
                 "col": 5,
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -35,17 +40,17 @@ class TestRopeFeatures:
             assert loc["line"] > 0
             assert loc["column"] > 0
 
-    def test_rope_occurrences_variable(self, httpx_client, temp_workspace):
+    def test_rope_occurrences_variable(self, shared_client, shared_workspace):
         """Test finding occurrences of a variable via /occurrences endpoint."""
         # Find occurrences of "message" variable in hello_world function
         # Line 14, column 5 is on the message variable
-        response = httpx_client.post(
+        response = shared_client.post(
             "/occurrences",
             json={
                 "file": "sample_module.py",
                 "line": 14,
                 "col": 5,
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -53,17 +58,17 @@ class TestRopeFeatures:
         data = response.json()
         assert_locations_response(data, min_count=2)  # definition + usage
 
-    def test_rope_occurrences_class(self, httpx_client, temp_workspace):
+    def test_rope_occurrences_class(self, shared_client, shared_workspace):
         """Test finding occurrences of a class name via /occurrences endpoint."""
         # Find occurrences of Calculator class
         # Line 24, column 7 is on the class definition
-        response = httpx_client.post(
+        response = shared_client.post(
             "/occurrences",
             json={
                 "file": "sample_module.py",
                 "line": 24,
                 "col": 7,
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -71,18 +76,18 @@ class TestRopeFeatures:
         data = response.json()
         assert_locations_response(data, min_count=2)  # definition + usages
 
-    def test_rope_rename_variable(self, httpx_client, temp_workspace):
+    def test_rope_rename_variable(self, shared_client, shared_workspace):
         """Test renaming a local variable via /rename endpoint."""
         # Rename "message" to "greeting_msg" in hello_world function
         # Line 14, column 5 is on the message variable
-        response = httpx_client.post(
+        response = shared_client.post(
             "/rename",
             json={
                 "file": "sample_module.py",
                 "line": 14,
                 "col": 5,
                 "new_name": "greeting_msg",
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -107,17 +112,17 @@ class TestRopeFeatures:
         assert 'greeting_msg = f"Hello, {name}!"' in sample_module_content
         assert "return greeting_msg" in sample_module_content
 
-    def test_rope_rename_function(self, httpx_client, temp_workspace):
+    def test_rope_rename_function(self, shared_client, shared_workspace):
         """Test renaming a function across multiple files via /rename endpoint."""
         # Rename hello_world to greet_user
-        response = httpx_client.post(
+        response = shared_client.post(
             "/rename",
             json={
                 "file": "sample_module.py",
                 "line": 4,
                 "col": 5,
                 "new_name": "greet_user",
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -137,17 +142,17 @@ class TestRopeFeatures:
             )
             assert "def greet_user" in sample_module_content
 
-    def test_rope_rename_class(self, httpx_client, temp_workspace):
+    def test_rope_rename_class(self, shared_client, shared_workspace):
         """Test renaming a class via /rename endpoint."""
         # Rename Calculator to MathCalculator
-        response = httpx_client.post(
+        response = shared_client.post(
             "/rename",
             json={
                 "file": "sample_module.py",
                 "line": 24,
                 "col": 7,
                 "new_name": "MathCalculator",
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -162,12 +167,12 @@ class TestRopeFeatures:
         )
         assert "class MathCalculator:" in sample_module_content
 
-    def test_rope_extract_variable(self, httpx_client, temp_workspace):
+    def test_rope_extract_variable(self, shared_client, shared_workspace):
         """Test extracting an expression to a variable via /extract-var endpoint."""
         # Extract "a + b" in calculate_sum function
         # Line 20 has "    result = a + b"
         # Column 16 is 'a', column 21 is after 'b'
-        response = httpx_client.post(
+        response = shared_client.post(
             "/extract-var",
             json={
                 "file": "sample_module.py",
@@ -176,7 +181,7 @@ class TestRopeFeatures:
                 "start_col": 16,
                 "end_col": 21,
                 "var_name": "temp_sum",
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -191,18 +196,18 @@ class TestRopeFeatures:
         )
         assert "temp_sum" in sample_module_content
 
-    def test_rope_extract_method(self, httpx_client, temp_workspace):
+    def test_rope_extract_method(self, shared_client, shared_workspace):
         """Test extracting code to a new method via /extract-method endpoint."""
         # Extract lines in hello_world that create the message
         # Line 14 to 14 (just the message creation line)
-        response = httpx_client.post(
+        response = shared_client.post(
             "/extract-method",
             json={
                 "file": "sample_module.py",
                 "start_line": 14,
                 "end_line": 14,
                 "method_name": "create_greeting",
-                "root": str(temp_workspace)
+                "root": str(shared_workspace)
             }
         )
 
@@ -223,7 +228,7 @@ class TestRopeFeatures:
         test_file = temp_workspace / "messy_imports.py"
         create_python_file(
             test_file,
-            """
+            b"""
 import os
 import sys
 
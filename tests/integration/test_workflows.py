@@ -3,8 +3,16 @@
 These tests verify that features work together correctly in realistic workflows.
 """
 
+import time
+
 import pytest
-from tests.utils import create_python_file, assert_patches_valid, assert_locations_response
+from tests.utils import (
+    create_python_file,
+    create_python_files,
+    assert_patches_valid,
+    assert_locations_response,
+    post_json,
+)
 
 
 @pytest.mark.integration
@@ -14,10 +22,8 @@ class TestCompleteRefactoringWorkflow:
     @pytest.fixture
     def django_like_project(self, temp_workspace):
         """Create a Django-like project structure."""
-        # models.py
-        create_python_file(
-            temp_workspace / "models.py",
-            """
+        files = {
+            "models.py": """
 from typing import Optional
 
 class User:
@@ -41,13 +47,9 @@ class UserManager:
     def find_by_email(self, email: str) -> Optional[User]:
         # Stub implementation
         return None
-"""
-        )
+""",
 
-        # views.py
-        create_python_file(
-            temp_workspace / "views.py",
-            """
+            "views.py": """
 from models import User, UserManager
 
 def register_user(username: str, email: str):
@@ -62,13 +64,9 @@ def get_user_info(email: str):
     if user:
         return user.get_full_name()
     return None
-"""
-        )
+""",
 
-        # tests.py
-        create_python_file(
-            temp_workspace / "tests.py",
-            """
+            "tests.py": """
 from models import User, UserManager
 from views import register_user
 
@@ -80,10 +78,10 @@ def test_user_creation():
 def test_registration():
     user = register_user("bob", "bob@test.com")
     assert user is not None
-"""
-        )
+""",
+        }
 
-        return temp_workspace
+        return create_python_files(temp_workspace, files)
 
     def test_workflow_explore_then_refactor(self, httpx_client, django_like_project):
         """
@@ -94,37 +92,35 @@ def test_registration():
         2. Rename User to Account
         3. Verify all files updated consistently
         """
-        root = django_like_project
+        root = str(django_like_project)
 
         # Step 1: Find all references to User class (line 4, col 7)
-        refs_response = httpx_client.post(
+        refs = post_json(
+            httpx_client,
             "/refs",
-            json={
+            {
                 "file": "models.py",
                 "line": 4,
                 "col": 7,
-                "root": str(root)
+                "root": root
             }
         )
-        assert refs_response.status_code == 200
-        refs = refs_response.json()
         # Should find references in multiple files
         assert_locations_response(refs, min_count=1)
 
         # Step 2: Rename User to Account
-        rename_response = httpx_client.post(
+        data = post_json(
+            httpx_client,
             "/rename",
-            json={
+            {
                 "file": "models.py",
                 "line": 4,
                 "col": 7,
                 "new_name": "Account",
-                "root": str(root),
+                "root": root,
                 "output_format": "full"
             }
         )
-        assert rename_response.status_code == 200
-        data = rename_response.json()
         patches = data["patches"]
 
         # Verify all files were updated
@@ -148,7 +144,7 @@ def test_registration():
         1. Extract method
         2. Organize imports
         """
-        root = django_like_project
+        root = str(django_like_project)
 
         # Step 1: Try to extract method (send_email logic)
         extract_response = httpx_client.post(
@@ -158,7 +154,7 @@ def test_registration():
                 "start_line": 14,
                 "end_line": 15,
                 "method_name": "send_notification",
-                "root": str(root)
+                "root": root
             }
         )
         # May or may not succeed depending on Rope's analysis
@@ -169,7 +165,7 @@ def test_registration():
             "/organize-imports",
             json={
                 "file": "models.py",
-                "root": str(root)
+                "root": root
             }
         )
         # Should succeed or return empty patches
@@ -184,48 +180,46 @@ def test_registration():
         2. Find occurrences
         3. Rename with better names
         """
-        root = django_like_project
+        root = str(django_like_project)
 
         # Step 1: Hover on get_full_name function (line 9, col 9)
-        hover_response = httpx_client.post(
+        hover_info = post_json(
+            httpx_client,
             "/hover",
-            json={
+            {
                 "file": "models.py",
                 "line": 9,
                 "col": 9,
-                "root": str(root)
+                "root": root
             }
         )
-        assert hover_response.status_code == 200
-        hover_info = hover_response.json()
         # Hover returns dict with name, type, signature, docstring
-        assert isinstance(hover_info, dict)
+        assert type(hover_info) is dict
 
         # Step 2: Find all occurrences of get_full_name
-        occ_response = httpx_client.post(
+        post_json(
+            httpx_client,
             "/occurrences",
-            json={
+            {
                 "file": "models.py",
                 "line": 9,
                 "col": 9,
-                "root": str(root)
+                "root": root
             }
         )
-        assert occ_response.status_code == 200
 
         # Step 3: Rename get_full_name to get_display_name
-        rename_response = httpx_client.post(
+        data = post_json(
+            httpx_client,
             "/rename",
-            json={
+            {
                 "file": "models.py",
                 "line": 9,
                 "col": 9,
                 "new_name": "get_display_name",
-                "root": str(root)
+                "root": root
             }
         )
-        assert rename_response.status_code == 200
-        data = rename_response.json()
         patches = data["patches"]
 
         # Verify rename propagated
@@ -242,13 +236,9 @@ class TestCrossCuttingConcerns:
     @pytest.fixture
     def layered_architecture(self, temp_workspace):
         """Create a multi-layer architecture (models/services/controllers)."""
-        # Domain layer
-        domain = temp_workspace / "domain"
-        domain.mkdir()
-
-        create_python_file(
-            domain / "entities.py",
-            """
+        files = {
+            # Domain layer
+            "domain/entities.py": """
 class Product:
     def __init__(self, name: str, price: float):
         self.name = name
@@ -264,16 +254,10 @@ class Order:
 
     def total(self) -> float:
         return self.product.price * self.quantity
-"""
-        )
+""",
 
-        # Service layer
-        services = temp_workspace / "services"
-        services.mkdir()
-
-        create_python_file(
-            services / "order_service.py",
-            """
+            # Service layer
+            "services/order_service.py": """
 import sys
 sys.path.insert(0, '..')
 from domain.entities import Product, Order
@@ -286,16 +270,10 @@ class OrderService:
 
     def calculate_order_total(self, order: Order) -> float:
         return order.total()
-"""
-        )
-
-        # Controller layer
-        controllers = temp_workspace / "controllers"
-        controllers.mkdir()
+""",
 
-        create_python_file(
-            controllers / "api.py",
-            """
+            # Controller layer
+            "controllers/api.py": """
 import sys
 sys.path.insert(0, '..')
 from domain.entities import Product, Order
@@ -309,28 +287,27 @@ class OrderController:
         order = self.service.create_order(name, price, qty)
         total = self.service.calculate_order_total(order)
         return {"order": order, "total": total}
-"""
-        )
+""",
+        }
 
-        return temp_workspace
+        return create_python_files(temp_workspace, files)
 
     def test_rename_across_layers(self, httpx_client, layered_architecture):
         """Test that rename works across architectural layers."""
-        root = layered_architecture
+        root = str(layered_architecture)
 
         # Rename Product class in domain layer (line 2, col 7)
-        response = httpx_client.post(
+        data = post_json(
+            httpx_client,
             "/rename",
-            json={
+            {
                 "file": "domain/entities.py",
                 "line": 2,
                 "col": 7,
                 "new_name": "Item",
-                "root": str(root)
+                "root": root
             }
         )
-        assert response.status_code == 200
-        data = response.json()
         patches = data["patches"]
 
         # Should update domain layer at minimum
@@ -341,20 +318,19 @@ class OrderController:
 
     def test_find_references_across_layers(self, httpx_client, layered_architecture):
         """Test finding references across architectural boundaries."""
-        root = layered_architecture
+        root = str(layered_architecture)
 
         # Find all references to Order class (line 10, col 7)
-        response = httpx_client.post(
+        data = post_json(
+            httpx_client,
             "/refs",
-            json={
+            {
                 "file": "domain/entities.py",
                 "line": 10,
                 "col": 7,
-                "root": str(root)
+                "root": root
             }
         )
-        assert response.status_code == 200
-        data = response.json()
 
         # Should find at least the definition
         assert_locations_response(data, min_count=1)
@@ -394,9 +370,10 @@ class TestErrorRecoveryWorkflows:
         )
 
         # Rename Foo to Bar - should work despite broken.py
-        response = httpx_client.post(
+        data = post_json(
+            httpx_client,
             "/rename",
-            json={
+            {
                 "file": "valid.py",
                 "line": 1,
                 "col": 7,
@@ -404,9 +381,6 @@ class TestErrorRecoveryWorkflows:
                 "root": str(temp_workspace)
             }
         )
-
-        assert response.status_code == 200
-        data = response.json()
         patches = data["patches"]
 
         # Should update valid.py
@@ -431,35 +405,34 @@ def process_value(val):
     return val * 2
 """
         )
+        root = str(temp_workspace)
 
         # Refactoring 1: Rename old_function
-        response1 = httpx_client.post(
+        patches1 = post_json(
+            httpx_client,
             "/rename",
-            json={
+            {
                 "file": "test.py",
                 "line": 2,
                 "col": 5,
                 "new_name": "new_function",
-                "root": str(temp_workspace)
+                "root": root
             }
-        )
-        assert response1.status_code == 200
-        patches1 = response1.json()["patches"]
+        )["patches"]
         assert "new_function" in patches1["test.py"]
 
         # Refactoring 2: Rename calculate_value (on original file)
-        response2 = httpx_client.post(
+        patches2 = post_json(
+            httpx_client,
             "/rename",
-            json={
+            {
                 "file": "test.py",
                 "line": 7,
                 "col": 5,
                 "new_name": "get_value",
-                "root": str(temp_workspace)
+                "root": root
             }
-        )
-        assert response2.status_code == 200
-        patches2 = response2.json()["patches"]
+        )["patches"]
         assert "get_value" in patches2["test.py"]
 
 
@@ -470,9 +443,8 @@ class TestIDELikeWorkflows:
     @pytest.fixture
     def project(self, temp_workspace):
         """Create a project for IDE-like interactions."""
-        create_python_file(
-            temp_workspace / "main.py",
-            """
+        files = {
+            "main.py": """
 from utils import helper_function
 
 def main():
@@ -482,12 +454,9 @@ def main():
 
 if __name__ == "__main__":
     main()
-"""
-        )
+""",
 
-        create_python_file(
-            temp_workspace / "utils.py",
-            """
+            "utils.py": """
 def helper_function(x: int) -> int:
     \"\"\"Calculate double value.
 
@@ -501,55 +470,54 @@ def helper_function(x: int) -> int:
 
 def another_helper(y: str) -> str:
     return y.upper()
-"""
-        )
+""",
+        }
 
-        return temp_workspace
+        return create_python_files(temp_workspace, files)
 
     def test_ide_goto_definition_workflow(self, httpx_client, project):
         """Simulate: user hovers, sees info, then goes to definition."""
+        root = str(project)
+
         # Step 1: Hover on helper_function to see signature (line 5, col 13)
-        hover_response = httpx_client.post(
+        hover = post_json(
+            httpx_client,
             "/hover",
-            json={
+            {
                 "file": "main.py",
                 "line": 5,
                 "col": 13,
-                "root": str(project)
+                "root": root
             }
         )
-        assert hover_response.status_code == 200
-        hover = hover_response.json()
-        assert isinstance(hover, dict)
+        assert type(hover) is dict
 
         # Step 2: Go to definition
-        defs_response = httpx_client.post(
+        defs = post_json(
+            httpx_client,
             "/defs",
-            json={
+            {
                 "file": "main.py",
                 "line": 5,
                 "col": 13,
-                "root": str(project)
+                "root": root
             }
         )
-        assert defs_response.status_code == 200
-        defs = defs_response.json()
         assert_locations_response(defs, min_count=1)
 
     def test_ide_find_all_usages_workflow(self, httpx_client, project):
         """Simulate: user wants to see all usages before renaming."""
         # Find all references to helper_function (line 2, col 5)
-        response = httpx_client.post(
+        data = post_json(
+            httpx_client,
             "/refs",
-            json={
+            {
                 "file": "utils.py",
                 "line": 2,
                 "col": 5,
                 "root": str(project)
             }
         )
-        assert response.status_code == 200
-        data = response.json()
 
         # Should find definition and usage(s)
         assert_locations_response(data, min_count=1)
@@ -557,9 +525,10 @@ def another_helper(y: str) -> str:
     def test_ide_refactor_with_preview(self, httpx_client, project):
         """Simulate: user previews changes before applying."""
         # Get preview of rename
-        response = httpx_client.post(
+        data = post_json(
+            httpx_client,
             "/rename",
-            json={
+            {
                 "file": "utils.py",
                 "line": 2,
                 "col": 5,
@@ -567,8 +536,6 @@ def another_helper(y: str) -> str:
                 "root": str(project)
             }
         )
-        assert response.status_code == 200
-        data = response.json()
         patches = data["patches"]
 
         # Should show changes
@@ -588,10 +555,8 @@ class TestPerformanceWorkflows:
     @pytest.fixture
     def medium_project(self, temp_workspace):
         """Create a medium-sized project (20 files)."""
-        for i in range(20):
-            create_python_file(
-                temp_workspace / f"module_{i}.py",
-                f"""
+        files = {
+            f"module_{i}.py": f"""
 class Service{i}:
     def __init__(self):
         self.name = "Service{i}"
@@ -602,28 +567,24 @@ class Service{i}:
 def create_service_{i}():
     return Service{i}()
 """
-            )
+            for i in range(20)
+        }
 
         # Create a main file that imports from all modules
         imports = "\n".join([f"from module_{i} import Service{i}" for i in range(20)])
         services_list = ", ".join([f"Service{i}()" for i in range(20)])
-        create_python_file(
-            temp_workspace / "main.py",
-            f"""
+        files["main.py"] = f"""
 {imports}
 
 def main():
     services = [{services_list}]
     return services
 """
-        )
 
-        return temp_workspace
+        return create_python_files(temp_workspace, files)
 
     def test_rename_performance(self, httpx_client, medium_project):
         """Test that rename completes in reasonable time."""
-        import time
-
         start = time.time()
         response = httpx_client.post(
             "/rename",
@@ -644,8 +605,6 @@ def main():
 
     def test_organize_imports_bulk_performance(self, httpx_client, medium_project):
         """Test organizing imports on a file."""
-        import time
-
         start = time.time()
         response = httpx_client.post(
             "/organize-imports",
@@ -1,14 +1,65 @@
 """Unit tests for FileWatcher."""
 
+import os
+import threading
 import time
-import tempfile
-from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
 from pyclide_server.file_watcher import PythonFileWatcher
 
+# Upper bound for a single event to arrive; tests return as soon as it does
+EVENT_TIMEOUT = 2.0
+
+
+class _Recorder:
+    """Watcher callback that records changed paths and lets tests wait on them."""
+
+    def __init__(self):
+        self.paths = []
+        self._changed = threading.Condition()
+
+    def __call__(self, rel_path: str):
+        with self._changed:
+            self.paths.append(rel_path)
+            self._changed.notify_all()
+
+    def wait_for(self, rel_path: str, timeout: float = EVENT_TIMEOUT) -> bool:
+        """Block until rel_path has been reported, or the timeout expires."""
+        with self._changed:
+            return self._changed.wait_for(lambda: rel_path in self.paths, timeout)
+
+
+def _start_watching(watcher: PythonFileWatcher, recorder: _Recorder):
+    """
+    Start the watcher and wait until it reports events.
+
+    Some backends arm their watches asynchronously, so a probe file is
+    touched until its event comes through. The recorder is cleared after.
+    """
+    watcher.start()
+    probe = watcher.root / "_watcher_ready.py"
+    deadline = time.monotonic() + EVENT_TIMEOUT
+    probe.write_text("# probe\n")
+    while not recorder.wait_for(probe.name, timeout=0.05):
+        assert time.monotonic() < deadline, "File watcher never became ready"
+        probe.write_text("# probe\n")
+    recorder.paths.clear()
+
+
+def _flush_events(watcher: PythonFileWatcher, recorder: _Recorder):
+    """
+    Wait until every event queued so far has been dispatched.
+
+    Events are delivered in order, so once a write to a fresh sentinel file
+    is reported, any earlier event has already reached the callback.
+    """
+    sentinel = watcher.root / "_watcher_sentinel.py"
+    sentinel.write_text("# sentinel\n")
+    assert recorder.wait_for(sentinel.name), "Sentinel event never arrived"
+    recorder.paths.remove(sentinel.name)
+
 
 @pytest.mark.unit
 class TestFileWatcher:
@@ -25,58 +76,47 @@ class TestFileWatcher:
 
     def test_watcher_detects_py_file_change(self, tmp_path):
         """Callback triggered on .py file modification."""
-        callback = Mock()
-        watcher = PythonFileWatcher(tmp_path, callback)
+        recorder = _Recorder()
+        watcher = PythonFileWatcher(tmp_path, recorder)
 
         # Create a Python file
         test_file = tmp_path / "test.py"
         test_file.write_text("# initial content\n")
 
-        # Start watching
-        watcher.start()
-        time.sleep(0.2)  # Give watchdog time to start
-
-        # Modify the file
-        test_file.write_text("# modified content\n")
+        _start_watching(watcher, recorder)
+        try:
+            # Modify the file
+            test_file.write_text("# modified content\n")
 
-        # Wait for event to be processed
-        time.sleep(0.5)
-
-        # Stop watching
-        watcher.stop()
-
-        # Callback should have been called
-        assert callback.call_count > 0
+            # Callback should have been called
+            assert recorder.wait_for("test.py")
+        finally:
+            watcher.stop()
 
     def test_watcher_ignores_non_py_files(self, tmp_path):
         """No callback for non-Python files."""
-        callback = Mock()
-        watcher = PythonFileWatcher(tmp_path, callback)
+        recorder = _Recorder()
+        watcher = PythonFileWatcher(tmp_path, recorder)
 
         # Create a non-Python file
         test_file = tmp_path / "test.txt"
         test_file.write_text("initial content\n")
 
-        # Start watching
-        watcher.start()
-        time.sleep(0.2)
-
-        # Modify the file
-        test_file.write_text("modified content\n")
-
-        # Wait
-        time.sleep(0.5)
-
-        # Stop watching
-        watcher.stop()
+        _start_watching(watcher, recorder)
+        try:
+            # Modify the file
+            test_file.write_text("modified content\n")
+            _flush_events(watcher, recorder)
+        finally:
+            watcher.stop()
 
         # Callback should NOT have been called
-        assert callback.call_count == 0
+        assert recorder.paths == []
 
     def test_watcher_respects_hardcoded_ignores(self, tmp_path):
         """Ignores __pycache__, .venv, etc."""
-        callback = Mock()
-        watcher = PythonFileWatcher(tmp_path, callback)
+        recorder = _Recorder()
+        watcher = PythonFileWatcher(tmp_path, recorder)
 
         # Create __pycache__ directory with .py file
         pycache_dir = tmp_path / "__pycache__"
@@ -84,98 +124,76 @@ class TestFileWatcher:
         test_file = pycache_dir / "test.py"
         test_file.write_text("# pycache file\n")
 
-        # Start watching
-        watcher.start()
-        time.sleep(0.2)
-
-        # Modify the file
-        test_file.write_text("# modified\n")
-
-        # Wait
-        time.sleep(0.5)
-
-        # Stop watching
-        watcher.stop()
+        _start_watching(watcher, recorder)
+        try:
+            # Modify the file
+            test_file.write_text("# modified\n")
+            _flush_events(watcher, recorder)
+        finally:
+            watcher.stop()
 
         # Callback should NOT have been called for __pycache__
-        assert callback.call_count == 0
+        assert recorder.paths == []
 
     def test_watcher_respects_gitignore(self, tmp_path):
         """Ignores files matching .gitignore patterns."""
-        callback = Mock()
+        recorder = _Recorder()
 
         # Create .gitignore
         gitignore = tmp_path / ".gitignore"
         gitignore.write_text("ignored_*.py\n")
 
-        watcher = PythonFileWatcher(tmp_path, callback)
+        watcher = PythonFileWatcher(tmp_path, recorder)
 
         # Create ignored file
         test_file = tmp_path / "ignored_test.py"
         test_file.write_text("# ignored\n")
 
-        # Start watching
-        watcher.start()
-        time.sleep(0.2)
-
-        # Modify the file
-        test_file.write_text("# modified\n")
-
-        # Wait
-        time.sleep(0.5)
-
-        # Stop watching
-        watcher.stop()
+        _start_watching(watcher, recorder)
+        try:
+            # Modify the file
+            test_file.write_text("# modified\n")
+            _flush_events(watcher, recorder)
+        finally:
+            watcher.stop()
 
         # Callback should NOT have been called for gitignored file
-        assert callback.call_count == 0
+        assert recorder.paths == []
 
     def test_watcher_handles_file_creation(self, tmp_path):
         """Callback on new file creation."""
-        callback = Mock()
-        watcher = PythonFileWatcher(tmp_path, callback)
-
-        # Start watching
-        watcher.start()
-        time.sleep(0.2)
-
-        # Create a new Python file
-        test_file = tmp_path / "new_file.py"
-        test_file.write_text("# new file\n")
+        recorder = _Recorder()
+        watcher = PythonFileWatcher(tmp_path, recorder)
 
-        # Wait for event
-        time.sleep(0.5)
-
-        # Stop watching
-        watcher.stop()
+        _start_watching(watcher, recorder)
+        try:
+            # Create a new Python file
+            test_file = tmp_path / "new_file.py"
+            test_file.write_text("# new file\n")
 
-        # Callback should have been called
-        assert callback.call_count > 0
+            # Callback should have been called
+            assert recorder.wait_for("new_file.py")
+        finally:
+            watcher.stop()
 
     def test_watcher_handles_file_deletion(self, tmp_path):
         """Callback on file deletion."""
-        callback = Mock()
-        watcher = PythonFileWatcher(tmp_path, callback)
+        recorder = _Recorder()
+        watcher = PythonFileWatcher(tmp_path, recorder)
 
         # Create a file before watching
         test_file = tmp_path / "to_delete.py"
         test_file.write_text("# will be deleted\n")
 
-        # Start watching
-        watcher.start()
-        time.sleep(0.2)
-
-        # Delete the file
-        test_file.unlink()
+        _start_watching(watcher, recorder)
+        try:
+            # Delete the file
+            test_file.unlink()
 
-        # Wait for event
-        time.sleep(0.5)
-
-        # Stop watching
-        watcher.stop()
-
-        # Callback should have been called
-        assert callback.call_count > 0
+            # Callback should have been called
+            assert recorder.wait_for("to_delete.py")
+        finally:
+            watcher.stop()
 
     def test_watcher_stop(self, tmp_path):
         """Watcher stops cleanly."""
@@ -184,35 +202,31 @@ class TestFileWatcher:
 
         # Start and immediately stop
         watcher.start()
-        time.sleep(0.1)
         watcher.stop()
 
         # Should not raise exception
         assert True
 
-    @pytest.mark.slow
     def test_watcher_debouncing(self, tmp_path):
         """Multiple rapid changes trigger callbacks (debouncing handled by callback)."""
-        callback = Mock()
-        watcher = PythonFileWatcher(tmp_path, callback)
+        recorder = _Recorder()
+        watcher = PythonFileWatcher(tmp_path, recorder)
 
         test_file = tmp_path / "debounce_test.py"
         test_file.write_text("# initial\n")
 
-        # Start watching
-        watcher.start()
-        time.sleep(0.2)
-
-        # Make multiple rapid changes
-        for i in range(5):
-            test_file.write_text(f"# change {i}\n")
-            time.sleep(0.05)
-
-        # Wait for events to be processed
-        time.sleep(1.0)
-
-        # Stop watching
-        watcher.stop()
-
-        # Should have been called multiple times (actual debouncing would be in callback logic)
-        assert callback.call_count > 0
+        _start_watching(watcher, recorder)
+        try:
+            # Make multiple rapid changes through one descriptor, synced once at the end
+            fd = os.open(test_file, os.O_WRONLY | os.O_TRUNC)
+            try:
+                for i in range(5):
+                    os.write(fd, f"# change {i}\n".encode())
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+            # Should have been called (actual debouncing would be in callback logic)
+            assert recorder.wait_for("debounce_test.py")
+        finally:
+            watcher.stop()
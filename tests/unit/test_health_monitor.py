@@ -2,27 +2,37 @@
 
 import asyncio
 import time
-from unittest.mock import Mock, AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from pyclide_server.health import HealthMonitor
+from pyclide_server import health
+from pyclide_server.health import HAS_PSUTIL, HealthMonitor
+
+requires_psutil = pytest.mark.skipif(not HAS_PSUTIL, reason="psutil not installed")
+
+
+@pytest.fixture
+def mock_server():
+    """Idle server stand-in exposing only the attributes HealthMonitor reads."""
+    now = time.time()
+    return SimpleNamespace(
+        last_activity=now,
+        start_time=now,
+        request_count=0,
+        root="/workspace",
+        jedi_cache={},
+        cache_invalidations=0,
+    )
 
 
 @pytest.mark.unit
 class TestHealthMonitor:
     """Test HealthMonitor functionality."""
 
-    def test_monitor_init(self):
+    def test_monitor_init(self, mock_server):
         """HealthMonitor initializes with server."""
-        mock_server = Mock()
-        mock_server.last_activity = time.time()
-        mock_server.start_time = time.time()
-        mock_server.request_count = 0
-        mock_server.root = "/workspace"
-        mock_server.jedi_cache = {}
-        mock_server.cache_invalidations = 0
-
         monitor = HealthMonitor(mock_server)
 
         assert monitor.server == mock_server
@@ -33,92 +43,56 @@ class TestHealthMonitor:
         assert monitor.memory_limit_mb == 1000
 
     @pytest.mark.asyncio
-    async def test_monitor_inactivity_timeout(self):
+    async def test_monitor_inactivity_timeout(self, mock_server, monkeypatch):
         """Shutdown triggered after inactivity threshold."""
-        mock_server = Mock()
-        mock_server.last_activity = time.time() - 7200  # 2 hours ago
-        mock_server.start_time = time.time()
-        mock_server.request_count = 0
-        mock_server.root = "/workspace"
-        mock_server.jedi_cache = {}
-        mock_server.cache_invalidations = 0
+        # Freeze the monitor's clock exactly 2 hours after the last activity
+        now = mock_server.last_activity + 7200
+        monkeypatch.setattr(health, "time", SimpleNamespace(time=lambda: now))
 
         monitor = HealthMonitor(mock_server)
         monitor.inactivity_timeout = 3600  # 1 hour
         monitor._graceful_shutdown = AsyncMock()
 
-        # Check if inactivity is detected
-        inactive_time = time.time() - mock_server.last_activity
-        assert inactive_time > monitor.inactivity_timeout
-
         # Simulate one check iteration
         await monitor._health_check()
 
         # Should trigger shutdown
         monitor._graceful_shutdown.assert_called_once()
 
+    @requires_psutil
     @pytest.mark.asyncio
-    async def test_monitor_memory_warning(self):
+    async def test_monitor_memory_warning(self, mock_server):
         """Warning logged at memory threshold (if psutil available)."""
-        mock_server = Mock()
-        mock_server.last_activity = time.time()
-        mock_server.start_time = time.time()
-        mock_server.request_count = 0
-        mock_server.root = "/workspace"
-        mock_server.jedi_cache = {}
-        mock_server.cache_invalidations = 0
-
         monitor = HealthMonitor(mock_server)
         monitor.memory_warning_mb = 1  # Very low threshold
 
         with patch('pyclide_server.health.logger') as mock_logger:
-            try:
-                import psutil
-                # Run health check
-                await monitor._health_check()
+            # Run health check
+            await monitor._health_check()
 
-                # Should log memory stats (warning or debug)
-                assert mock_logger.warning.called or mock_logger.debug.called
-            except ImportError:
-                # psutil not available, skip
-                pytest.skip("psutil not installed")
+            # Should log memory stats (warning or debug)
+            assert mock_logger.warning.called or mock_logger.debug.called
 
+    @requires_psutil
     @pytest.mark.asyncio
-    async def test_monitor_memory_limit_shutdown(self):
+    async def test_monitor_memory_limit_shutdown(self, mock_server):
         """Shutdown triggered at memory limit."""
-        mock_server = Mock()
-        mock_server.last_activity = time.time()
-        mock_server.start_time = time.time()
-        mock_server.request_count = 0
-        mock_server.root = "/workspace"
-        mock_server.jedi_cache = {}
-        mock_server.cache_invalidations = 0
-
         # Set unrealistically low memory limit to trigger shutdown
         monitor = HealthMonitor(mock_server)
         monitor.memory_limit_mb = 1
         monitor._graceful_shutdown = AsyncMock()
 
-        try:
-            import psutil
-            # Run health check
-            await monitor._health_check()
+        # Run health check
+        await monitor._health_check()
 
-            # Should trigger shutdown due to memory limit
-            monitor._graceful_shutdown.assert_called_once()
-        except ImportError:
-            pytest.skip("psutil not installed")
+        # Should trigger shutdown due to memory limit
+        monitor._graceful_shutdown.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_monitor_health_check_updates_stats(self):
+    async def test_monitor_health_check_updates_stats(self, mock_server):
         """Health check logs server stats."""
-        mock_server = Mock()
-        mock_server.last_activity = time.time()
         mock_server.start_time = time.time() - 100  # Running for 100 seconds
         mock_server.request_count = 42
-        mock_server.root = "/workspace"
-        mock_server.jedi_cache = {}
-        mock_server.cache_invalidations = 0
 
         monitor = HealthMonitor(mock_server)
 
@@ -132,16 +106,8 @@ class TestHealthMonitor:
             assert "42" in call_args  # request count
 
     @pytest.mark.asyncio
-    async def test_monitor_stop(self):
+    async def test_monitor_stop(self, mock_server):
         """Monitor stops gracefully."""
-        mock_server = Mock()
-        mock_server.last_activity = time.time()
-        mock_server.start_time = time.time()
-        mock_server.request_count = 0
-        mock_server.root = "/workspace"
-        mock_server.jedi_cache = {}
-        mock_server.cache_invalidations = 0
-
         monitor = HealthMonitor(mock_server)
         monitor.running = True
 
@@ -150,24 +116,21 @@ class TestHealthMonitor:
         assert monitor.running is False
 
     @pytest.mark.asyncio
-    async def test_monitor_start_stop_cycle(self):
+    async def test_monitor_start_stop_cycle(self, mock_server):
         """Monitor can start and stop properly."""
-        mock_server = Mock()
-        mock_server.last_activity = time.time()
-        mock_server.start_time = time.time()
-        mock_server.request_count = 0
-        mock_server.root = "/workspace"
-        mock_server.jedi_cache = {}
-        mock_server.cache_invalidations = 0
-
         monitor = HealthMonitor(mock_server)
-        monitor.check_interval = 0.1  # Fast for testing
+        monitor.check_interval = 0.01  # Fast for testing
+        checked = asyncio.Event()
+        monitor._health_check = AsyncMock(side_effect=checked.set)
 
         # Start monitoring in background
         task = asyncio.create_task(monitor.start())
 
-        # Wait a bit
-        await asyncio.sleep(0.2)
+        # Wait until the loop has run one health check
+        try:
+            await asyncio.wait_for(checked.wait(), timeout=1.0)
+        except asyncio.TimeoutError:
+            pytest.fail("Monitor never ran a health check")
 
         # Stop monitoring
         monitor.stop()
@@ -179,15 +142,10 @@ class TestHealthMonitor:
             pytest.fail("Monitor did not stop within timeout")
 
     @pytest.mark.asyncio
-    async def test_monitor_no_shutdown_when_active(self):
+    async def test_monitor_no_shutdown_when_active(self, mock_server):
         """No shutdown when server is active."""
-        mock_server = Mock()
         mock_server.last_activity = time.time()  # Just now
-        mock_server.start_time = time.time()
         mock_server.request_count = 100
-        mock_server.root = "/workspace"
-        mock_server.jedi_cache = {}
-        mock_server.cache_invalidations = 0
 
         monitor = HealthMonitor(mock_server)
         monitor.inactivity_timeout = 3600  # 1 hour
@@ -1,11 +1,35 @@
 """Unit tests for Jedi helper functions."""
 
 import tempfile
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
+import jedi
 import pytest
 
 from pyclide_server.jedi_helpers import jedi_to_locations, jedi_script
+from tests.utils import create_python_files
+
+# Minimal project for the scripts below: no sys.path discovery or scanning
+_JEDI_PROJECT = jedi.Project(tempfile.gettempdir(), smart_sys_path=False)
+
+
+@dataclass
+class MockDef:
+    """Stand-in for a Jedi Name with only the attributes jedi_to_locations reads."""
+
+    name: Optional[str] = "test"
+    line: Optional[int] = 5
+    column: Optional[int] = 10
+    type: Optional[str] = "function"
+    module_path: Optional[str] = "/path/to/file.py"
+
+
+def _inline_script(source: str) -> jedi.Script:
+    """Build a Jedi Script from source in memory, under a virtual path."""
+    path = Path(tempfile.gettempdir()) / "pyclide_inline.py"
+    return jedi.Script(code=source, path=path, project=_JEDI_PROJECT)
 
 
 @pytest.mark.unit
@@ -15,57 +39,36 @@ class TestJediHelpers:
 
     def test_jedi_to_locations_valid(self):
         """jedi_to_locations converts definitions correctly."""
-        # Create a simple test file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write("def hello():\n    pass\n")
-            test_file = Path(f.name)
-
-        try:
-            import jedi
-            script = jedi.Script(path=str(test_file))
-            # Get definitions for 'hello'
-            results = script.goto(1, 4)  # On 'def hello'
+        script = _inline_script("def hello():\n    pass\n")
+        # Get definitions for 'hello'
+        results = script.goto(1, 4)  # On 'def hello'
 
-            locations = jedi_to_locations(results)
-
-            # Should have at least one result
-            assert len(locations) > 0
+        locations = jedi_to_locations(results)
 
-            # Check structure
-            loc = locations[0]
-            assert "path" in loc
-            assert "line" in loc
-            assert "column" in loc
-            assert loc["line"] > 0
-            assert loc["column"] >= 0
+        # Should have at least one result
+        assert len(locations) > 0
 
-        finally:
-            test_file.unlink()
+        # Check structure
+        loc = locations[0]
+        assert "path" in loc
+        assert "line" in loc
+        assert "column" in loc
+        assert loc["line"] > 0
+        assert loc["column"] >= 0
 
     def test_jedi_to_locations_empty(self):
         """jedi_to_locations handles empty results."""
         locations = jedi_to_locations([])
         assert locations == []
-        assert isinstance(locations, list)
+        assert type(locations) is list
 
     def test_jedi_to_locations_no_module_path(self):
         """jedi_to_locations filters out results without module_path."""
         # Mock objects without module_path
-        class MockName:
-            def __init__(self, has_path):
-                self.name = "test"
-                self.line = 1
-                self.column = 0
-                self.type = "function"
-                if has_path:
-                    self.module_path = "/path/to/file.py"
-                else:
-                    self.module_path = None
-
         mock_results = [
-            MockName(True),   # Has module_path
-            MockName(False),  # No module_path
-            MockName(True),   # Has module_path
+            MockDef(line=1, column=0),                    # Has module_path
+            MockDef(line=1, column=0, module_path=None),  # No module_path
+            MockDef(line=1, column=0),                    # Has module_path
         ]
 
         locations = jedi_to_locations(mock_results)
@@ -80,59 +83,50 @@ class TestJediHelpers:
 
     def test_jedi_to_locations_structure(self):
         """jedi_to_locations creates correct structure."""
-        # Create a test file with a simple function
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write("def test_func():\n    return 42\n")
-            test_file = Path(f.name)
-
-        try:
-            import jedi
-            script = jedi.Script(path=str(test_file))
-            results = script.goto(1, 4)  # On 'def test_func'
+        script = _inline_script("def test_func():\n    return 42\n")
+        results = script.goto(1, 4)  # On 'def test_func'
 
-            locations = jedi_to_locations(results)
-
-            if len(locations) > 0:
-                loc = locations[0]
+        locations = jedi_to_locations(results)
 
-                # Check all required keys
-                assert "path" in loc
-                assert "line" in loc
-                assert "column" in loc
+        if len(locations) > 0:
+            loc = locations[0]
 
-                # Check types
-                assert isinstance(loc["path"], str)
-                assert isinstance(loc["line"], int)
-                assert isinstance(loc["column"], int)
+            # Check all required keys
+            assert "path" in loc
+            assert "line" in loc
+            assert "column" in loc
 
-                # Check values are reasonable
-                assert loc["line"] > 0
-                assert loc["column"] >= 0
+            # Check types
+            assert isinstance(loc["path"], str)
+            assert isinstance(loc["line"], int)
+            assert isinstance(loc["column"], int)
 
-        finally:
-            test_file.unlink()
+            # Check values are reasonable
+            assert loc["line"] > 0
+            assert loc["column"] >= 0
 
     def test_jedi_to_locations_with_builtin(self):
         """jedi_to_locations handles builtin definitions gracefully."""
-        # Create a script that references a builtin
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write("x = len([1, 2, 3])\n")
-            test_file = Path(f.name)
+        script = _inline_script("x = len([1, 2, 3])\n")
+        # Try to goto definition of 'len' (builtin)
+        results = script.goto(1, 5)
 
-        try:
-            import jedi
-            script = jedi.Script(path=str(test_file))
-            # Try to goto definition of 'len' (builtin)
-            results = script.goto(1, 5)
+        # This should not crash
+        locations = jedi_to_locations(results)
 
-            # This should not crash
-            locations = jedi_to_locations(results)
+        # Results depend on Jedi version, but should be a list
+        assert type(locations) is list
 
-            # Results depend on Jedi version, but should be a list
-            assert isinstance(locations, list)
 
-        finally:
-            test_file.unlink()
+@pytest.fixture(scope="module")
+def script_root(tmp_path_factory):
+    """Read-only tree shared by the jedi_script path tests: test.py, src/module.py, subdir/."""
+    root = create_python_files(tmp_path_factory.mktemp("jedi_script"), {
+        "test.py": b"def hello():\n    pass\n",
+        "src/module.py": b"x = 1\n",
+    })
+    (root / "subdir").mkdir()
+    return root
 
 
 @pytest.mark.unit
@@ -140,43 +134,31 @@ class TestJediHelpers:
 class TestJediScript:
     """Test jedi_script() function with all edge cases."""
 
-    def test_jedi_script_valid_file(self, tmp_path):
+    def test_jedi_script_valid_file(self, script_root):
         """jedi_script creates Script for valid file."""
-        test_file = tmp_path / "test.py"
-        test_file.write_text("def hello():\n    pass\n")
-
-        import jedi
-        script = jedi_script(tmp_path, "test.py")
+        script = jedi_script(script_root, "test.py")
 
         assert script is not None
         assert isinstance(script, jedi.Script)
 
-    def test_jedi_script_with_relative_path(self, tmp_path):
+    def test_jedi_script_with_relative_path(self, script_root):
         """jedi_script handles relative path correctly."""
-        subdir = tmp_path / "src"
-        subdir.mkdir()
-        test_file = subdir / "module.py"
-        test_file.write_text("x = 1\n")
-
-        script = jedi_script(tmp_path, "src/module.py")
+        script = jedi_script(script_root, "src/module.py")
 
         assert script is not None
 
-    def test_jedi_script_with_absolute_path(self, tmp_path):
+    def test_jedi_script_with_absolute_path(self, script_root):
         """jedi_script handles absolute path correctly."""
-        test_file = tmp_path / "test.py"
-        test_file.write_text("x = 1\n")
-
         # Pass absolute path as file_path
-        script = jedi_script(tmp_path, str(test_file))
+        script = jedi_script(script_root, str(script_root / "test.py"))
 
         assert script is not None
 
-    def test_jedi_script_nonexistent_file(self, tmp_path):
+    def test_jedi_script_nonexistent_file(self, script_root):
         """jedi_script handles non-existent file."""
         # Jedi raises FileNotFoundError for non-existent files
         with pytest.raises(FileNotFoundError):
-            script = jedi_script(tmp_path, "nonexistent.py")
+            script = jedi_script(script_root, "nonexistent.py")
 
     def test_jedi_script_with_syntax_error(self, tmp_path):
         """jedi_script handles file with syntax error."""
@@ -207,37 +189,25 @@ class TestJediScript:
 
         assert script is not None
 
-    def test_jedi_script_path_resolution(self, tmp_path):
+    def test_jedi_script_path_resolution(self, script_root):
         """jedi_script resolves path correctly."""
-        test_file = tmp_path / "test.py"
-        test_file.write_text("x = 1\n")
-
-        script = jedi_script(tmp_path, "test.py")
+        script = jedi_script(script_root, "test.py")
 
         # Script should have correct path
         assert script is not None
         # script.path can be string or Path, convert to string
         assert str(script.path).endswith("test.py")
 
-    def test_jedi_script_with_dots_in_path(self, tmp_path):
+    def test_jedi_script_with_dots_in_path(self, script_root):
         """jedi_script handles path with .. correctly."""
-        subdir = tmp_path / "subdir"
-        subdir.mkdir()
-        test_file = tmp_path / "test.py"
-        test_file.write_text("x = 1\n")
-
         # Use relative path with ..
-        script = jedi_script(subdir, "../test.py")
+        script = jedi_script(script_root / "subdir", "../test.py")
 
         assert script is not None
 
-    def test_jedi_script_returns_jedi_script_type(self, tmp_path):
+    def test_jedi_script_returns_jedi_script_type(self, script_root):
         """jedi_script always returns jedi.Script instance."""
-        test_file = tmp_path / "test.py"
-        test_file.write_text("def func():\n    pass\n")
-
-        import jedi
-        script = jedi_script(tmp_path, "test.py")
+        script = jedi_script(script_root, "test.py")
 
         assert isinstance(script, jedi.Script)
 
@@ -247,128 +217,56 @@ class TestJediScript:
 class TestJediToLocationsExtended:
     """Extended tests for jedi_to_locations() edge cases."""
 
-    def test_jedi_to_locations_with_none_column(self):
-        """jedi_to_locations handles results with column=None."""
-        class MockName:
-            def __init__(self):
-                self.name = "test"
-                self.line = 5
-                self.column = None  # None column
-                self.type = "function"
-                self.module_path = "/path/to/file.py"
-
-        results = [MockName()]
-        locations = jedi_to_locations(results)
-
-        assert len(locations) == 1
-        # Should default column to 1
-        assert locations[0]["column"] == 1
-
-    def test_jedi_to_locations_with_none_name(self):
-        """jedi_to_locations handles results with name=None."""
-        class MockName:
-            def __init__(self):
-                self.name = None
-                self.line = 5
-                self.column = 10
-                self.type = "module"
-                self.module_path = "/path/to/file.py"
-
-        results = [MockName()]
-        locations = jedi_to_locations(results)
-
-        assert len(locations) == 1
-        assert locations[0]["name"] is None
-
-    def test_jedi_to_locations_with_none_type(self):
-        """jedi_to_locations handles results with type=None."""
-        class MockName:
-            def __init__(self):
-                self.name = "test"
-                self.line = 5
-                self.column = 10
-                self.type = None
-                self.module_path = "/path/to/file.py"
-
-        results = [MockName()]
-        locations = jedi_to_locations(results)
-
-        assert len(locations) == 1
-        assert locations[0]["type"] is None
+    @pytest.mark.parametrize(
+        "mock,expected",
+        [
+            pytest.param(
+                MockDef(name="test_function", line=42, column=8,
+                        module_path="/home/user/project/module.py"),
+                {"path": "/home/user/project/module.py", "line": 42, "column": 8,
+                 "name": "test_function", "type": "function"},
+                id="all_fields_present",
+            ),
+            # Missing column defaults to 1
+            pytest.param(
+                MockDef(column=None),
+                {"path": "/path/to/file.py", "line": 5, "column": 1,
+                 "name": "test", "type": "function"},
+                id="none_column",
+            ),
+            pytest.param(
+                MockDef(name=None, type="module"),
+                {"path": "/path/to/file.py", "line": 5, "column": 10,
+                 "name": None, "type": "module"},
+                id="none_name",
+            ),
+            pytest.param(
+                MockDef(type=None),
+                {"path": "/path/to/file.py", "line": 5, "column": 10,
+                 "name": "test", "type": None},
+                id="none_type",
+            ),
+        ],
+    )
+    def test_jedi_to_locations_fields(self, mock, expected):
+        """jedi_to_locations maps each field, tolerating missing optional ones."""
+        assert jedi_to_locations([mock]) == [expected]
 
     def test_jedi_to_locations_mixed_valid_invalid(self):
         """jedi_to_locations filters mixed valid and invalid results."""
-        class ValidName:
-            def __init__(self):
-                self.name = "valid"
-                self.line = 5
-                self.column = 10
-                self.type = "function"
-                self.module_path = "/path/to/file.py"
-
-        class InvalidName:
-            def __init__(self):
-                self.name = "invalid"
-                self.line = None  # Invalid: None line
-                self.column = 10
-                self.type = "function"
-                self.module_path = "/path/to/file.py"
-
-        class NoPathName:
-            def __init__(self):
-                self.name = "no_path"
-                self.line = 5
-                self.column = 10
-                self.type = "function"
-                self.module_path = None  # Invalid: None module_path
-
-        results = [ValidName(), InvalidName(), NoPathName(), ValidName()]
+        valid = MockDef(name="valid")
+        invalid = MockDef(name="invalid", line=None)  # Invalid: None line
+        no_path = MockDef(name="no_path", module_path=None)  # Invalid: None module_path
+
+        results = [valid, invalid, no_path, valid]
         locations = jedi_to_locations(results)
 
         # Should only include the 2 valid ones
         assert len(locations) == 2
 
-    def test_jedi_to_locations_all_fields_present(self):
-        """jedi_to_locations includes all expected fields."""
-        class MockName:
-            def __init__(self):
-                self.name = "test_function"
-                self.line = 42
-                self.column = 8
-                self.type = "function"
-                self.module_path = "/home/user/project/module.py"
-
-        results = [MockName()]
-        locations = jedi_to_locations(results)
-
-        assert len(locations) == 1
-        loc = locations[0]
-
-        # Check all fields
-        assert "path" in loc
-        assert "line" in loc
-        assert "column" in loc
-        assert "name" in loc
-        assert "type" in loc
-
-        # Check values
-        assert loc["path"] == "/home/user/project/module.py"
-        assert loc["line"] == 42
-        assert loc["column"] == 8
-        assert loc["name"] == "test_function"
-        assert loc["type"] == "function"
-
     def test_jedi_to_locations_column_zero(self):
         """jedi_to_locations handles column=0."""
-        class MockName:
-            def __init__(self):
-                self.name = "test"
-                self.line = 1
-                self.column = 0  # Zero column
-                self.type = "variable"
-                self.module_path = "/path/to/file.py"
-
-        results = [MockName()]
+        results = [MockDef(line=1, column=0, type="variable")]
         locations = jedi_to_locations(results)
 
         assert len(locations) == 1
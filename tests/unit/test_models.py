@@ -15,6 +15,26 @@ from pyclide_server.models import (
 class TestModels:
     """Test Pydantic model validation."""
 
+    @pytest.mark.parametrize(
+        "model,kwargs",
+        [
+            pytest.param(DefsRequest, {"file": "test.py", "line": 10},
+                         id="defs_missing_col_and_root"),
+            pytest.param(RenameRequest,
+                         {"file": "test.py", "line": 10, "col": 5, "root": "/workspace"},
+                         id="rename_missing_new_name"),
+            pytest.param(ExtractMethodRequest,
+                         {"file": "test.py", "start_line": 10, "end_line": 15, "root": "/workspace"},
+                         id="extract_method_missing_method_name"),
+            pytest.param(OrganizeImportsRequest, {"root": "/workspace"},
+                         id="organize_imports_missing_file"),
+        ],
+    )
+    def test_request_missing_required_fields(self, model, kwargs):
+        """Requests missing a required field are rejected."""
+        with pytest.raises(ValidationError):
+            model(**kwargs)
+
     def test_defs_request_validation(self):
         """DefsRequest validates required fields."""
         # Valid request
@@ -24,9 +44,17 @@ class TestModels:
         assert req.col == 5
         assert req.root == "/workspace"
 
-        # Missing required fields
+    def test_refs_request_scope(self):
+        """RefsRequest defaults to project scope and only accepts known scopes."""
+        req = RefsRequest(file="test.py", line=10, col=5, root="/workspace")
+        assert req.scope == "project"
+
+        req2 = RefsRequest(file="test.py", line=10, col=5, root="/workspace", scope="file")
+        assert req2.scope == "file"
+
+        # Unknown scope
         with pytest.raises(ValidationError):
-            DefsRequest(file="test.py", line=10)  # missing col and root
+            RefsRequest(file="test.py", line=10, col=5, root="/workspace", scope="module")
 
     def test_rename_request_validation(self):
         """RenameRequest validates required fields."""
@@ -36,10 +64,6 @@ class TestModels:
         )
         assert req.new_name == "new_func"
 
-        # Missing new_name
-        with pytest.raises(ValidationError):
-            RenameRequest(file="test.py", line=10, col=5, root="/workspace")
-
     def test_extract_var_request_optional_fields(self):
         """ExtractVarRequest handles optional column fields."""
         # With all fields
@@ -143,15 +167,6 @@ class TestModels:
         assert req.end_line == 15
         assert req.method_name == "extracted_method"
 
-        # Missing method_name
-        with pytest.raises(ValidationError):
-            ExtractMethodRequest(
-                file="test.py",
-                start_line=10,
-                end_line=15,
-                root="/workspace"
-            )
-
     def test_occurrences_request_validation(self):
         """OccurrencesRequest validates correctly."""
         req = OccurrencesRequest(
@@ -172,7 +187,3 @@ class TestModels:
         )
         assert req.file == "test.py"
         assert req.root == "/workspace"
-
-        # Missing file
-        with pytest.raises(ValidationError):
-            OrganizeImportsRequest(root="/workspace")
@@ -17,6 +17,13 @@ from pathlib import Path
 import pytest
 
 from pyclide_server.rope_engine import RopeEngine
+from tests.fixture_sources import (
+    EXTRACT_METHOD_SOURCE,
+    EXTRACT_VARIABLE_SOURCE,
+    FROM_IMPORT_SOURCE,
+    OLD_NAME_USAGE_SOURCE,
+    SIMPLE_FUNCTION_SOURCE,
+)
 
 
 @pytest.mark.unit
@@ -98,9 +105,12 @@ class TestRopeEngineRes:
 @pytest.mark.unit
 @pytest.mark.rope
 class TestRopeEngineOccurrences:
-    """Test RopeEngine.occurrences() method."""
+    """Test RopeEngine.occurrences() method.
 
-    def test_occurrences_simple_variable(self, tmp_path):
+    Engines come from rope_engine_cache, so tests on identical trees share one.
+    """
+
+    def test_occurrences_simple_variable(self, tmp_path, rope_engine_cache):
         """Find occurrences of a local variable."""
         test_file = tmp_path / "test.py"
         test_file.write_text("""
@@ -110,15 +120,15 @@ def func():
     return x
 """)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Line 3, col 5 = 'x' in "x = 10"
         results = engine.occurrences("test.py", 3, 5)
 
-        assert isinstance(results, list)
+        assert type(results) is list
         # Should find at least the definition
         assert len(results) >= 1
 
-    def test_occurrences_function_name(self, tmp_path):
+    def test_occurrences_function_name(self, tmp_path, rope_engine_cache):
         """Find occurrences of a function."""
         test_file = tmp_path / "test.py"
         test_file.write_text("""
@@ -128,11 +138,11 @@ def hello():
 result = hello()
 """)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Line 2, col 5 = 'hello' definition
         results = engine.occurrences("test.py", 2, 5)
 
-        assert isinstance(results, list)
+        assert type(results) is list
         assert len(results) >= 1
         # Check structure
         if results:
@@ -140,7 +150,7 @@ result = hello()
             assert "line" in results[0]
             assert "column" in results[0]
 
-    def test_occurrences_class_name(self, tmp_path):
+    def test_occurrences_class_name(self, tmp_path, rope_engine_cache):
         """Find occurrences of a class."""
         test_file = tmp_path / "test.py"
         test_file.write_text("""
@@ -150,40 +160,40 @@ class MyClass:
 obj = MyClass()
 """)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Line 2, col 7 = 'MyClass'
         results = engine.occurrences("test.py", 2, 7)
 
-        assert isinstance(results, list)
+        assert type(results) is list
         # Should find definition and usage
         assert len(results) >= 1
 
-    def test_occurrences_out_of_bounds_line(self, tmp_path):
+    def test_occurrences_out_of_bounds_line(self, tmp_path, rope_engine_cache):
         """Occurrences with line out of bounds."""
         test_file = tmp_path / "test.py"
         test_file.write_text("x = 1\n")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Line 100 is out of bounds - Rope handles gracefully, returns empty
         try:
             results = engine.occurrences("test.py", 100, 1)
             # If succeeds, should be empty list
-            assert isinstance(results, list)
+            assert type(results) is list
         except Exception:
             # Also acceptable if Rope raises
             pass
 
-    def test_occurrences_out_of_bounds_column(self, tmp_path):
+    def test_occurrences_out_of_bounds_column(self, tmp_path, rope_engine_cache):
         """Occurrences with column out of bounds."""
         test_file = tmp_path / "test.py"
         test_file.write_text("x = 1\n")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Column 1000 is out of bounds
         with pytest.raises(Exception):
             engine.occurrences("test.py", 1, 1000)
 
-    def test_occurrences_on_whitespace(self, tmp_path):
+    def test_occurrences_on_whitespace(self, tmp_path, rope_engine_cache):
         """Occurrences on whitespace/comment."""
         test_file = tmp_path / "test.py"
         test_file.write_text("""
@@ -192,56 +202,56 @@ obj = MyClass()
 x = 1
 """)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Line 2 is a comment
         # Rope might return empty or raise
         try:
             results = engine.occurrences("test.py", 2, 1)
-            assert isinstance(results, list)
+            assert type(results) is list
         except Exception:
             # Acceptable - Rope can't find symbol on comment
             pass
 
-    def test_occurrences_on_keyword(self, tmp_path):
+    def test_occurrences_on_keyword(self, tmp_path, rope_engine_cache):
         """Occurrences on Python keyword."""
         test_file = tmp_path / "test.py"
         test_file.write_text("def func():\n    pass\n")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Line 1, col 1 = 'def' keyword
         try:
             results = engine.occurrences("test.py", 1, 1)
             # If succeeds, should be empty or minimal
-            assert isinstance(results, list)
+            assert type(results) is list
         except Exception:
             # Acceptable - keywords don't have occurrences
             pass
 
-    def test_occurrences_empty_file(self, tmp_path):
+    def test_occurrences_empty_file(self, tmp_path, rope_engine_cache):
         """Occurrences on empty file."""
         test_file = tmp_path / "test.py"
         test_file.write_text("")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Should handle gracefully
         with pytest.raises(Exception):
             engine.occurrences("test.py", 1, 1)
 
-    def test_occurrences_file_with_syntax_error(self, tmp_path):
+    def test_occurrences_file_with_syntax_error(self, tmp_path, rope_engine_cache):
         """Occurrences on file with syntax error."""
         test_file = tmp_path / "test.py"
         test_file.write_text("def broken(\n")  # Syntax error
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Rope has ignore_syntax_errors=True, might still work or fail gracefully
         try:
             results = engine.occurrences("test.py", 1, 5)
-            assert isinstance(results, list)
+            assert type(results) is list
         except Exception:
             # Acceptable - syntax errors can prevent analysis
             pass
 
-    def test_occurrences_cross_file(self, tmp_path):
+    def test_occurrences_cross_file(self, tmp_path, rope_engine_cache):
         """Occurrences across multiple files."""
         file1 = tmp_path / "module.py"
         file1.write_text("def shared_func():\n    pass\n")
@@ -249,20 +259,23 @@ x = 1
         file2 = tmp_path / "usage.py"
         file2.write_text("from module import shared_func\nshared_func()\n")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Find occurrences of shared_func
         results = engine.occurrences("module.py", 1, 5)
 
         # Might find cross-file occurrences
-        assert isinstance(results, list)
+        assert type(results) is list
 
 
 @pytest.mark.unit
 @pytest.mark.rope
 class TestRopeEngineRename:
-    """Test RopeEngine.rename() method."""
+    """Test RopeEngine.rename() method.
+
+    Engines come from rope_engine_cache, so tests on identical trees share one.
+    """
 
-    def test_rename_local_variable(self, tmp_path):
+    def test_rename_local_variable(self, tmp_path, rope_engine_cache):
         """Rename a local variable."""
         test_file = tmp_path / "test.py"
         test_file.write_text("""
@@ -271,17 +284,17 @@ def func():
     return old_name
 """)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         patches = engine.rename("test.py", 3, 5, "new_name", output_format="full")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
         assert len(patches) > 0
         # Should contain new name
         content = list(patches.values())[0]
         assert "new_name" in content
         assert "old_name" not in content or content.count("new_name") >= content.count("old_name")
 
-    def test_rename_function(self, tmp_path):
+    def test_rename_function(self, tmp_path, rope_engine_cache):
         """Rename a function."""
         test_file = tmp_path / "test.py"
         test_file.write_text("""
@@ -291,14 +304,14 @@ def old_func():
 result = old_func()
 """)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         patches = engine.rename("test.py", 2, 5, "new_func", output_format="full")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
         content = list(patches.values())[0]
         assert "new_func" in content
 
-    def test_rename_class(self, tmp_path):
+    def test_rename_class(self, tmp_path, rope_engine_cache):
         """Rename a class."""
         test_file = tmp_path / "test.py"
         test_file.write_text("""
@@ -308,77 +321,77 @@ class OldClass:
 obj = OldClass()
 """)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         patches = engine.rename("test.py", 2, 7, "NewClass", output_format="full")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
         content = list(patches.values())[0]
         assert "NewClass" in content
 
-    def test_rename_cross_file(self, tmp_path):
+    def test_rename_cross_file(self, tmp_path, rope_engine_cache):
         """Rename across multiple files."""
         file1 = tmp_path / "module.py"
         file1.write_text("def old_name():\n    pass\n")
 
         file2 = tmp_path / "usage.py"
-        file2.write_text("from module import old_name\nold_name()\n")
+        file2.write_bytes(OLD_NAME_USAGE_SOURCE)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         patches = engine.rename("module.py", 1, 5, "new_name", output_format="full")
 
         # Should modify both files
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
         # May have 1 or 2 files depending on Rope's scope analysis
         assert len(patches) >= 1
 
-    def test_rename_with_invalid_name(self, tmp_path):
+    def test_rename_with_invalid_name(self, tmp_path, rope_engine_cache):
         """Rename with invalid Python identifier."""
         test_file = tmp_path / "test.py"
         test_file.write_text("x = 1\n")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Invalid name with spaces/special chars - Rope might accept or reject
         try:
             patches = engine.rename("test.py", 1, 1, "invalid name!", output_format="full")
             # If succeeds, should still return dict
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             # Also acceptable if Rope rejects invalid names
             pass
 
-    def test_rename_builtin(self, tmp_path):
+    def test_rename_builtin(self, tmp_path, rope_engine_cache):
         """Attempt to rename a builtin (should fail or ignore)."""
         test_file = tmp_path / "test.py"
         test_file.write_text("x = len([1, 2, 3])\n")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Try to rename 'len' - should fail or return empty
         try:
             patches = engine.rename("test.py", 1, 5, "my_len", output_format="full")
             # If succeeds, should not modify builtins
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             # Acceptable - can't rename builtins
             pass
 
-    def test_rename_out_of_bounds(self, tmp_path):
+    def test_rename_out_of_bounds(self, tmp_path, rope_engine_cache):
         """Rename with out of bounds position."""
         test_file = tmp_path / "test.py"
         test_file.write_text("x = 1\n")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         with pytest.raises(Exception):
             engine.rename("test.py", 100, 100, "new_name", output_format="full")
 
-    def test_rename_returns_dict(self, tmp_path):
+    def test_rename_returns_dict(self, tmp_path, rope_engine_cache):
         """Rename always returns Dict[str, str]."""
         test_file = tmp_path / "test.py"
         test_file.write_text("x = 1\n")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         patches = engine.rename("test.py", 1, 1, "y", output_format="full")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
         for key, value in patches.items():
             assert isinstance(key, str)
             assert isinstance(value, str)
@@ -387,29 +400,26 @@ obj = OldClass()
 @pytest.mark.unit
 @pytest.mark.rope
 class TestRopeEngineExtractMethod:
-    """Test RopeEngine.extract_method() method."""
+    """Test RopeEngine.extract_method() method.
+
+    Engines come from rope_engine_cache, so tests on identical trees share one.
+    """
 
-    def test_extract_method_single_line(self, tmp_path):
+    def test_extract_method_single_line(self, tmp_path, rope_engine_cache):
         """Extract single line to method."""
         test_file = tmp_path / "test.py"
-        test_file.write_text("""
-def func():
-    x = 10
-    y = 20
-    z = x + y
-    return z
-""")
+        test_file.write_bytes(EXTRACT_METHOD_SOURCE)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Extract line 5 (z = x + y)
         patches = engine.extract_method("test.py", 5, 5, "calc_sum", output_format="full")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
         if patches:  # Rope might refuse if not valid extraction
             content = list(patches.values())[0]
             assert "calc_sum" in content
 
-    def test_extract_method_multiple_lines(self, tmp_path):
+    def test_extract_method_multiple_lines(self, tmp_path, rope_engine_cache):
         """Extract multiple lines to method."""
         test_file = tmp_path / "test.py"
         test_file.write_text("""
@@ -420,55 +430,51 @@ def func():
     return c
 """)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Extract lines 3-4
         patches = engine.extract_method("test.py", 3, 4, "compute", output_format="full")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
-    def test_extract_method_start_greater_than_end(self, tmp_path):
+    def test_extract_method_start_greater_than_end(self, tmp_path, rope_engine_cache):
         """Extract with start_line > end_line."""
         test_file = tmp_path / "test.py"
-        test_file.write_text("""
-def func():
-    x = 10
-    return x
-""")
+        test_file.write_bytes(SIMPLE_FUNCTION_SOURCE)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # start=4, end=3 (reversed)
         # Rope might handle this or raise
         try:
             patches = engine.extract_method("test.py", 4, 3, "extracted", output_format="full")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             # Acceptable - invalid range
             pass
 
-    def test_extract_method_out_of_bounds(self, tmp_path):
+    def test_extract_method_out_of_bounds(self, tmp_path, rope_engine_cache):
         """Extract with line out of bounds."""
         test_file = tmp_path / "test.py"
         test_file.write_text("x = 1\n")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         with pytest.raises(Exception):
             engine.extract_method("test.py", 10, 20, "extracted", output_format="full")
 
-    def test_extract_method_invalid_name(self, tmp_path):
+    def test_extract_method_invalid_name(self, tmp_path, rope_engine_cache):
         """Extract with invalid method name."""
         test_file = tmp_path / "test.py"
         test_file.write_text("def func():\n    x = 1\n")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Rope might accept or reject invalid names
         try:
             patches = engine.extract_method("test.py", 2, 2, "invalid-name", output_format="full")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             # Also acceptable
             pass
 
-    def test_extract_method_duplicate_name(self, tmp_path):
+    def test_extract_method_duplicate_name(self, tmp_path, rope_engine_cache):
         """Extract with method name that already exists."""
         test_file = tmp_path / "test.py"
         test_file.write_text("""
@@ -480,12 +486,12 @@ def func():
     return x
 """)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Try to extract with name "existing"
         try:
             patches = engine.extract_method("test.py", 6, 6, "existing", output_format="full")
             # Rope might allow or reject duplicate names
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             # Acceptable - duplicate name
             pass
@@ -494,25 +500,24 @@ def func():
 @pytest.mark.unit
 @pytest.mark.rope
 class TestRopeEngineExtractVariable:
-    """Test RopeEngine.extract_variable() method."""
+    """Test RopeEngine.extract_variable() method.
+
+    Engines come from rope_engine_cache, so tests on identical trees share one.
+    """
 
-    def test_extract_var_with_both_columns(self, tmp_path):
+    def test_extract_var_with_both_columns(self, tmp_path, rope_engine_cache):
         """Extract variable with start_col and end_col."""
         test_file = tmp_path / "test.py"
-        test_file.write_text("""
-def func():
-    result = 10 + 20
-    return result
-""")
+        test_file.write_bytes(EXTRACT_VARIABLE_SOURCE)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Extract "10 + 20" on line 3
         # Columns are approximate (depends on spacing)
         patches = engine.extract_variable("test.py", 3, 3, "sum_val", start_col=14, end_col=21, output_format="full")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
-    def test_extract_var_only_start_col(self, tmp_path):
+    def test_extract_var_only_start_col(self, tmp_path, rope_engine_cache):
         """Extract variable with only start_col (to end of line)."""
         test_file = tmp_path / "test.py"
         test_file.write_text("""
@@ -521,49 +526,41 @@ def func():
     return x
 """)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Extract from col 9 to end of line
         patches = engine.extract_variable("test.py", 3, 3, "expr", start_col=9, end_col=None, output_format="full")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
-    def test_extract_var_only_end_col(self, tmp_path):
+    def test_extract_var_only_end_col(self, tmp_path, rope_engine_cache):
         """Extract variable with only end_col (from start of line)."""
         test_file = tmp_path / "test.py"
-        test_file.write_text("""
-def func():
-    x = 10
-    return x
-""")
+        test_file.write_bytes(SIMPLE_FUNCTION_SOURCE)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Extract from line start to col 10 - Rope might require complete statements
         try:
             patches = engine.extract_variable("test.py", 3, 3, "val", start_col=None, end_col=10, output_format="full")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             # Acceptable - Rope might reject incomplete statements
             pass
 
-    def test_extract_var_no_columns(self, tmp_path):
+    def test_extract_var_no_columns(self, tmp_path, rope_engine_cache):
         """Extract variable with no columns (entire line/range)."""
         test_file = tmp_path / "test.py"
-        test_file.write_text("""
-def func():
-    x = 10
-    return x
-""")
+        test_file.write_bytes(SIMPLE_FUNCTION_SOURCE)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # No columns specified - may include whitespace/syntax that Rope rejects
         try:
             patches = engine.extract_variable("test.py", 3, 3, "extracted", start_col=None, end_col=None, output_format="full")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             # Acceptable - entire line might include invalid syntax for extraction
             pass
 
-    def test_extract_var_multiline(self, tmp_path):
+    def test_extract_var_multiline(self, tmp_path, rope_engine_cache):
         """Extract variable across multiple lines."""
         test_file = tmp_path / "test.py"
         test_file.write_text("""
@@ -574,35 +571,35 @@ def func():
     return result
 """)
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Try to extract lines 3-4
         try:
             patches = engine.extract_variable("test.py", 3, 4, "expr", output_format="full")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             # Might not be valid for variable extraction
             pass
 
-    def test_extract_var_column_out_of_bounds(self, tmp_path):
+    def test_extract_var_column_out_of_bounds(self, tmp_path, rope_engine_cache):
         """Extract variable with column out of bounds."""
         test_file = tmp_path / "test.py"
         test_file.write_text("x = 10\n")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Column 1000 is out of bounds
         with pytest.raises(Exception):
             engine.extract_variable("test.py", 1, 1, "val", start_col=1, end_col=1000, output_format="full")
 
-    def test_extract_var_invalid_name(self, tmp_path):
+    def test_extract_var_invalid_name(self, tmp_path, rope_engine_cache):
         """Extract variable with invalid name."""
         test_file = tmp_path / "test.py"
         test_file.write_text("x = 10\n")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Rope might accept or reject invalid names
         try:
             patches = engine.extract_variable("test.py", 1, 1, "invalid-var", start_col=5, end_col=7, output_format="full")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             # Also acceptable
             pass
@@ -611,9 +608,12 @@ def func():
 @pytest.mark.unit
 @pytest.mark.rope
 class TestRopeEngineMove:
-    """Test RopeEngine.move() method."""
+    """Test RopeEngine.move() method.
+
+    Engines come from rope_engine_cache, so tests on identical trees share one.
+    """
 
-    def test_move_function_symbol_level(self, tmp_path):
+    def test_move_function_symbol_level(self, tmp_path, rope_engine_cache):
         """Move a function to another file (symbol-level)."""
         source = tmp_path / "source.py"
         source.write_text("""
@@ -624,15 +624,15 @@ def my_func():
         target = tmp_path / "target.py"
         target.write_text("# target file\n")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Move my_func (line 2, col 5)
         patches = engine.move("source.py", "target.py", line=2, col=5, output_format="full")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
         # Should modify both source and target
         assert len(patches) >= 1
 
-    def test_move_module_level(self, tmp_path):
+    def test_move_module_level(self, tmp_path, rope_engine_cache):
         """Move entire module (line=None, col=None)."""
         source = tmp_path / "source.py"
         source.write_text("def func():\n    pass\n")  # Valid Python code without comments
@@ -640,32 +640,32 @@ def my_func():
         target = tmp_path / "target.py"
         target.write_text("")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Module-level move with offset=0 requires valid identifier at position 0
         # This might work for function definitions but not for comments/whitespace
         try:
             patches = engine.move("source.py", "target.py", line=1, col=5, output_format="full")  # On "func"
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             # Module-level move is complex and might fail in various cases
             pass
 
-    def test_move_to_nonexistent_file(self, tmp_path):
+    def test_move_to_nonexistent_file(self, tmp_path, rope_engine_cache):
         """Move to a file that doesn't exist yet."""
         source = tmp_path / "source.py"
         source.write_text("def func():\n    pass\n")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Target doesn't exist
         try:
             patches = engine.move("source.py", "new_target.py", line=1, col=5, output_format="full")
             # Rope might create it or fail
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             # Acceptable if Rope requires existing target
             pass
 
-    def test_move_class(self, tmp_path):
+    def test_move_class(self, tmp_path, rope_engine_cache):
         """Move a class to another file."""
         source = tmp_path / "source.py"
         source.write_text("""
@@ -677,12 +677,12 @@ class MyClass:
         target = tmp_path / "target.py"
         target.write_text("")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         patches = engine.move("source.py", "target.py", line=2, col=7, output_format="full")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
-    def test_move_with_line_only(self, tmp_path):
+    def test_move_with_line_only(self, tmp_path, rope_engine_cache):
         """Move with line but no column (should use default)."""
         source = tmp_path / "source.py"
         source.write_text("def func():\n    pass\n")
@@ -690,11 +690,11 @@ class MyClass:
         target = tmp_path / "target.py"
         target.write_text("")
 
-        engine = RopeEngine(tmp_path)
+        engine = rope_engine_cache(tmp_path)
         # Only line, no col - should still work via offset=0
         try:
             patches = engine.move("source.py", "target.py", line=1, col=None, output_format="full")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             # Rope might require both or neither
             pass
@@ -703,7 +703,11 @@ class MyClass:
 @pytest.mark.unit
 @pytest.mark.rope
 class TestRopeEngineOrganizeImports:
-    """Test RopeEngine.organize_imports() method."""
+    """Test RopeEngine.organize_imports() method.
+
+    organize_imports() resolves absolute paths against the project, so each
+    test builds its own engine rather than sharing a cached one.
+    """
 
     def test_organize_imports_single_file(self, tmp_path):
         """Organize imports in a single file."""
@@ -724,28 +728,28 @@ def use_imports():
         engine = RopeEngine(tmp_path)
         patches = engine.organize_imports(test_file, convert_froms=False, output_format="full")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
         # May or may not have changes depending on what Rope considers organized
 
     def test_organize_imports_convert_froms_false(self, tmp_path):
         """Organize imports with convert_froms=False."""
         test_file = tmp_path / "test.py"
-        test_file.write_text("from os import path\nprint(path.exists('.'))\n")
+        test_file.write_bytes(FROM_IMPORT_SOURCE)
 
         engine = RopeEngine(tmp_path)
         patches = engine.organize_imports(test_file, convert_froms=False, output_format="full")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
     def test_organize_imports_convert_froms_true(self, tmp_path):
         """Organize imports with convert_froms=True."""
         test_file = tmp_path / "test.py"
-        test_file.write_text("from os import path\nprint(path.exists('.'))\n")
+        test_file.write_bytes(FROM_IMPORT_SOURCE)
 
         engine = RopeEngine(tmp_path)
         patches = engine.organize_imports(test_file, convert_froms=True, output_format="full")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
         # Might convert "from os import path" to "import os"
 
     def test_organize_imports_directory(self, tmp_path):
@@ -762,9 +766,20 @@ def use_imports():
         engine = RopeEngine(tmp_path)
         patches = engine.organize_imports(subdir, convert_froms=False, output_format="full")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
         # May organize multiple files
 
+    def test_organize_imports_directory_skips_import_free_files(self, tmp_path):
+        """Files without any import statement are skipped and yield no patch."""
+        (tmp_path / "messy.py").write_text("import sys\nimport os\nprint(os.getcwd())\n")
+        (tmp_path / "plain.py").write_text("x = 1\nprint(x)\n")
+
+        engine = RopeEngine(tmp_path)
+        patches = engine.organize_imports(tmp_path, convert_froms=False, output_format="full")
+
+        assert "plain.py" not in patches
+        assert "import sys" not in patches["messy.py"]
+
     def test_organize_imports_nonexistent_path(self, tmp_path):
         """Organize imports with non-existent path raises ValueError."""
         engine = RopeEngine(tmp_path)
@@ -782,7 +797,7 @@ def use_imports():
         patches = engine.organize_imports(test_file, convert_froms=False, output_format="full")
 
         # Should return empty dict (no changes)
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
         assert len(patches) == 0
 
     def test_organize_imports_already_organized(self, tmp_path):
@@ -794,7 +809,7 @@ def use_imports():
         patches = engine.organize_imports(test_file, convert_froms=False, output_format="full")
 
         # Might return empty if already organized
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
     def test_organize_imports_with_syntax_error(self, tmp_path):
         """Organize imports on file with syntax error (silently handled)."""
@@ -805,7 +820,7 @@ def use_imports():
         # Should not crash, silently skip file
         patches = engine.organize_imports(test_file, convert_froms=False, output_format="full")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
         # Should be empty (couldn't process)
 
     def test_organize_imports_unused_imports(self, tmp_path):
@@ -817,4 +832,4 @@ def use_imports():
         patches = engine.organize_imports(test_file, convert_froms=False, output_format="full")
 
         # Rope might or might not remove unused imports
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
@@ -10,7 +10,14 @@ import re
 
 import pytest
 
-from pyclide_server.rope_engine import RopeEngine
+from pyclide_server.rope_engine import RopeEngine, _generate_unified_diff
+from tests.fixture_sources import (
+    EXTRACT_METHOD_SOURCE,
+    EXTRACT_VARIABLE_SOURCE,
+    FROM_IMPORT_SOURCE,
+    OLD_NAME_USAGE_SOURCE,
+    SIMPLE_FUNCTION_SOURCE,
+)
 
 
 def apply_unified_diff(original_content: str, diff_text: str) -> str:
@@ -123,14 +130,8 @@ def old_name():
     def test_extract_method_diff_correctness(self, tmp_path):
         """Extract method diff should apply correctly."""
         test_file = tmp_path / "test.py"
-        original_content = """
-def func():
-    x = 10
-    y = 20
-    z = x + y
-    return z
-"""
-        test_file.write_text(original_content)
+        original_content = EXTRACT_METHOD_SOURCE.decode()
+        test_file.write_bytes(EXTRACT_METHOD_SOURCE)
 
         engine = RopeEngine(tmp_path)
 
@@ -145,12 +146,8 @@ def func():
     def test_extract_variable_diff_correctness(self, tmp_path):
         """Extract variable diff should apply correctly."""
         test_file = tmp_path / "test.py"
-        original_content = """
-def func():
-    result = 10 + 20
-    return result
-"""
-        test_file.write_text(original_content)
+        original_content = EXTRACT_VARIABLE_SOURCE.decode()
+        test_file.write_bytes(EXTRACT_VARIABLE_SOURCE)
 
         engine = RopeEngine(tmp_path)
 
@@ -195,8 +192,8 @@ print(json.dumps({}))
         file1.write_text(content1)
 
         file2 = tmp_path / "usage.py"
-        content2 = "from module import old_name\nold_name()\n"
-        file2.write_text(content2)
+        content2 = OLD_NAME_USAGE_SOURCE.decode()
+        file2.write_bytes(OLD_NAME_USAGE_SOURCE)
 
         engine = RopeEngine(tmp_path)
 
@@ -244,7 +241,7 @@ print(json.dumps({}))
         patches = engine.organize_imports(test_file, convert_froms=False, output_format="diff")
 
         # Should be empty or minimal
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
     def test_large_file_diff_efficiency(self, tmp_path):
         """Diff should be significantly smaller than full for large files."""
@@ -318,7 +315,7 @@ def old_name():
         engine = RopeEngine(tmp_path)
         patches = engine.rename("test.py", 2, 5, "new_name")  # Default: diff format
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
         assert len(patches) == 1
 
         diff = patches["test.py"]
@@ -338,7 +335,7 @@ def old_name():
         engine = RopeEngine(tmp_path)
         patches = engine.rename("test.py", 1, 1, "z", output_format="diff")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
         diff = patches["test.py"]
 
         # Verify it's a diff, not full content
@@ -421,13 +418,7 @@ def yet_another():
     def test_extract_method_generates_diff(self, tmp_path):
         """Extract method returns unified diff."""
         test_file = tmp_path / "test.py"
-        test_file.write_text("""
-def func():
-    x = 10
-    y = 20
-    z = x + y
-    return z
-""")
+        test_file.write_bytes(EXTRACT_METHOD_SOURCE)
 
         engine = RopeEngine(tmp_path)
         patches = engine.extract_method("test.py", 5, 5, "calc_sum")
@@ -440,11 +431,7 @@ def func():
     def test_extract_variable_generates_diff(self, tmp_path):
         """Extract variable returns unified diff."""
         test_file = tmp_path / "test.py"
-        test_file.write_text("""
-def func():
-    result = 10 + 20
-    return result
-""")
+        test_file.write_bytes(EXTRACT_VARIABLE_SOURCE)
 
         engine = RopeEngine(tmp_path)
         patches = engine.extract_variable("test.py", 3, 3, "sum_val", start_col=14, end_col=21)
@@ -507,7 +494,7 @@ print(os.getcwd())
         patches = engine.organize_imports(test_file, convert_froms=False)
 
         # No changes = empty dict
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
         # May be empty or may have changes depending on Rope's view of "organized"
 
     def test_diff_includes_context_lines(self, tmp_path):
@@ -535,13 +522,13 @@ def old_name():
         file1.write_text("def old_name():\n    pass\n")
 
         file2 = tmp_path / "usage.py"
-        file2.write_text("from module import old_name\nold_name()\n")
+        file2.write_bytes(OLD_NAME_USAGE_SOURCE)
 
         engine = RopeEngine(tmp_path)
         patches = engine.rename("module.py", 1, 5, "new_name")
 
         # Should have patches for modified files
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
         # All patches should be diffs (not full content)
         for path, content in patches.items():
@@ -584,7 +571,7 @@ class TestRenameEdgeCasesDiff:
         engine = RopeEngine(tmp_path)
         try:
             patches = engine.rename("test.py", 1, 1, "invalid name!", output_format="diff")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             pass  # Also acceptable if Rope rejects
 
@@ -596,7 +583,7 @@ class TestRenameEdgeCasesDiff:
         engine = RopeEngine(tmp_path)
         try:
             patches = engine.rename("test.py", 1, 5, "my_len", output_format="diff")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             pass  # Acceptable
 
@@ -657,16 +644,12 @@ def func():
     def test_extract_method_start_greater_than_end_diff(self, tmp_path):
         """Extract with start_line > end_line in diff format."""
         test_file = tmp_path / "test.py"
-        test_file.write_text("""
-def func():
-    x = 10
-    return x
-""")
+        test_file.write_bytes(SIMPLE_FUNCTION_SOURCE)
 
         engine = RopeEngine(tmp_path)
         try:
             patches = engine.extract_method("test.py", 4, 3, "extracted", output_format="diff")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             pass  # Acceptable
 
@@ -687,7 +670,7 @@ def func():
         engine = RopeEngine(tmp_path)
         try:
             patches = engine.extract_method("test.py", 2, 2, "invalid-name", output_format="diff")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             pass
 
@@ -706,7 +689,7 @@ def func():
         engine = RopeEngine(tmp_path)
         try:
             patches = engine.extract_method("test.py", 6, 6, "existing", output_format="diff")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             pass
 
@@ -737,32 +720,24 @@ def func():
     def test_extract_var_only_end_col_diff(self, tmp_path):
         """Extract variable with only end_col in diff format."""
         test_file = tmp_path / "test.py"
-        test_file.write_text("""
-def func():
-    x = 10
-    return x
-""")
+        test_file.write_bytes(SIMPLE_FUNCTION_SOURCE)
 
         engine = RopeEngine(tmp_path)
         try:
             patches = engine.extract_variable("test.py", 3, 3, "val", start_col=None, end_col=10, output_format="diff")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             pass
 
     def test_extract_var_no_columns_diff(self, tmp_path):
         """Extract variable with no columns in diff format."""
         test_file = tmp_path / "test.py"
-        test_file.write_text("""
-def func():
-    x = 10
-    return x
-""")
+        test_file.write_bytes(SIMPLE_FUNCTION_SOURCE)
 
         engine = RopeEngine(tmp_path)
         try:
             patches = engine.extract_variable("test.py", 3, 3, "extracted", start_col=None, end_col=None, output_format="diff")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             pass
 
@@ -780,7 +755,7 @@ def func():
         engine = RopeEngine(tmp_path)
         try:
             patches = engine.extract_variable("test.py", 3, 4, "expr", output_format="diff")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             pass
 
@@ -801,7 +776,7 @@ def func():
         engine = RopeEngine(tmp_path)
         try:
             patches = engine.extract_variable("test.py", 1, 1, "invalid-var", start_col=5, end_col=7, output_format="diff")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             pass
 
@@ -822,7 +797,7 @@ class TestMoveEdgeCasesDiff:
         engine = RopeEngine(tmp_path)
         try:
             patches = engine.move("source.py", "target.py", line=1, col=5, output_format="diff")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             pass
 
@@ -834,7 +809,7 @@ class TestMoveEdgeCasesDiff:
         engine = RopeEngine(tmp_path)
         try:
             patches = engine.move("source.py", "new_target.py", line=1, col=5, output_format="diff")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             pass
 
@@ -855,7 +830,7 @@ class MyClass:
         diff_patches = engine.move("source.py", "target.py", line=2, col=7, output_format="diff")
         full_patches = engine.move("source.py", "target.py", line=2, col=7, output_format="full")
 
-        assert isinstance(diff_patches, dict)
+        assert type(diff_patches) is dict
         # Verify diffs apply correctly
         if "source.py" in diff_patches:
             patched = apply_unified_diff(source_content, diff_patches["source.py"])
@@ -872,7 +847,7 @@ class MyClass:
         engine = RopeEngine(tmp_path)
         try:
             patches = engine.move("source.py", "target.py", line=1, col=None, output_format="diff")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             pass
 
@@ -885,8 +860,8 @@ class TestOrganizeImportsEdgeCasesDiff:
     def test_organize_imports_convert_froms_false_diff(self, tmp_path):
         """Organize imports with convert_froms=False in diff format."""
         test_file = tmp_path / "test.py"
-        original = "from os import path\nprint(path.exists('.'))\n"
-        test_file.write_text(original)
+        original = FROM_IMPORT_SOURCE.decode()
+        test_file.write_bytes(FROM_IMPORT_SOURCE)
 
         engine = RopeEngine(tmp_path)
         diff_patches = engine.organize_imports(test_file, convert_froms=False, output_format="diff")
@@ -899,8 +874,8 @@ class TestOrganizeImportsEdgeCasesDiff:
     def test_organize_imports_convert_froms_true_diff(self, tmp_path):
         """Organize imports with convert_froms=True in diff format."""
         test_file = tmp_path / "test.py"
-        original = "from os import path\nprint(path.exists('.'))\n"
-        test_file.write_text(original)
+        original = FROM_IMPORT_SOURCE.decode()
+        test_file.write_bytes(FROM_IMPORT_SOURCE)
 
         engine = RopeEngine(tmp_path)
         diff_patches = engine.organize_imports(test_file, convert_froms=True, output_format="diff")
@@ -955,7 +930,7 @@ class TestOrganizeImportsEdgeCasesDiff:
         engine = RopeEngine(tmp_path)
         patches = engine.organize_imports(test_file, convert_froms=False, output_format="diff")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
     def test_organize_imports_with_syntax_error_diff(self, tmp_path):
         """Organize imports on file with syntax error in diff format."""
@@ -965,7 +940,7 @@ class TestOrganizeImportsEdgeCasesDiff:
         engine = RopeEngine(tmp_path)
         patches = engine.organize_imports(test_file, convert_froms=False, output_format="diff")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
     def test_organize_imports_unused_imports_diff(self, tmp_path):
         """Organize imports might remove unused imports in diff format."""
@@ -975,7 +950,7 @@ class TestOrganizeImportsEdgeCasesDiff:
         engine = RopeEngine(tmp_path)
         patches = engine.organize_imports(test_file, convert_froms=False, output_format="diff")
 
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
 
 @pytest.mark.unit
@@ -1001,7 +976,7 @@ class TestDiffSpecificEdgeCases:
         patches = engine.rename("test.py", 1, 1, "anything", output_format="diff")
 
         # Should handle gracefully (empty or error)
-        assert isinstance(patches, dict)
+        assert type(patches) is dict
 
     def test_diff_file_with_only_whitespace(self, tmp_path):
         """Diff handles files with only whitespace."""
@@ -1011,7 +986,7 @@ class TestDiffSpecificEdgeCases:
         engine = RopeEngine(tmp_path)
         try:
             patches = engine.organize_imports(test_file, convert_froms=False, output_format="diff")
-            assert isinstance(patches, dict)
+            assert type(patches) is dict
         except Exception:
             pass
 
@@ -1190,8 +1165,6 @@ class TestDiffHelper:
 
     def test_generate_diff_with_changes(self):
         """_generate_unified_diff produces valid diff."""
-        from pyclide_server.rope_engine import _generate_unified_diff
-
         old_content = "line 1\nold line\nline 3\n"
         new_content = "line 1\nnew line\nline 3\n"
 
@@ -1204,8 +1177,6 @@ class TestDiffHelper:
 
     def test_generate_diff_no_changes(self):
         """_generate_unified_diff returns empty for identical content."""
-        from pyclide_server.rope_engine import _generate_unified_diff
-
         content = "line 1\nline 2\nline 3\n"
         diff = _generate_unified_diff("test.py", content, content)
 
@@ -1214,8 +1185,6 @@ class TestDiffHelper:
 
     def test_generate_diff_multiple_hunks(self):
         """_generate_unified_diff handles multiple change hunks."""
-        from pyclide_server.rope_engine import _generate_unified_diff
-
         old_content = "line 1\nold_a\nline 3\nline 4\nline 5\nold_b\nline 7\n"
         new_content = "line 1\nnew_a\nline 3\nline 4\nline 5\nnew_b\nline 7\n"
 
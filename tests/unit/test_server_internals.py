@@ -18,7 +18,6 @@ from unittest.mock import Mock, patch, MagicMock
 import pytest
 
 from pyclide_server.server import PyCLIDEServer
-from pyclide_server.rope_engine import RopeEngine
 
 
 @pytest.mark.unit
@@ -70,6 +69,9 @@ class TestGetRopeEngine:
 
     def test_get_rope_engine_lazy_init(self, tmp_path):
         """_get_rope_engine() creates RopeEngine on first call."""
+        # Imported here so collecting this module does not load Rope
+        from pyclide_server.rope_engine import RopeEngine
+
         server = PyCLIDEServer(str(tmp_path), 8888)
 
         # Initially None
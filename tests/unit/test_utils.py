@@ -16,44 +16,32 @@ from pyclide_server.utils import byte_offset, rel_to
 class TestByteOffset:
     """Test byte_offset() function with all edge cases."""
 
-    def test_simple_start_of_file(self):
-        """Line 1, col 1 returns offset 0."""
-        text = "hello\nworld\n"
-        assert byte_offset(text, 1, 1) == 0
-
-    def test_simple_first_line(self):
-        """Position within first line."""
-        text = "hello world\n"
-        # Line 1, col 7 = 'w' in "world"
-        assert byte_offset(text, 1, 7) == 6
-
-    def test_simple_second_line(self):
-        """Position on second line."""
-        text = "hello\nworld\n"
-        # Line 2, col 1 = 'w' in "world"
-        assert byte_offset(text, 2, 1) == 6  # "hello\n" = 6 bytes
-
-    def test_second_line_middle(self):
-        """Position in middle of second line."""
-        text = "hello\nworld\n"
-        # Line 2, col 3 = 'r' in "world"
-        assert byte_offset(text, 2, 3) == 8  # "hello\nwo" = 8 bytes
-
-    def test_empty_file(self):
-        """Empty text returns 0."""
-        assert byte_offset("", 1, 1) == 0
-
-    def test_empty_lines(self):
-        """Text with empty lines."""
-        text = "hello\n\nworld\n"
-        # Line 3, col 1 = 'w' in "world"
-        assert byte_offset(text, 3, 1) == 7  # "hello\n\n" = 7 bytes
-
-    def test_only_newlines(self):
-        """Text with only newlines."""
-        text = "\n\n\n"
-        # Line 2, col 1
-        assert byte_offset(text, 2, 1) == 1  # "\n" = 1 byte
+    @pytest.mark.parametrize(
+        "text,line,col,expected",
+        [
+            # Line 1, col 1 is offset 0
+            pytest.param("hello\nworld\n", 1, 1, 0, id="start_of_file"),
+            # 'w' in "hello world"
+            pytest.param("hello world\n", 1, 7, 6, id="first_line"),
+            # 'w' after "hello\n" (6 bytes)
+            pytest.param("hello\nworld\n", 2, 1, 6, id="second_line"),
+            # 'r' after "hello\nwo" (8 bytes)
+            pytest.param("hello\nworld\n", 2, 3, 8, id="second_line_middle"),
+            pytest.param("", 1, 1, 0, id="empty_file"),
+            # 'w' after "hello\n\n" (7 bytes)
+            pytest.param("hello\n\nworld\n", 3, 1, 7, id="empty_lines"),
+            pytest.param("\n\n\n", 2, 1, 1, id="only_newlines"),
+            pytest.param("hello\nworld", 2, 1, 6, id="no_trailing_newline"),
+            # 'w' after "hello\t" (6 bytes)
+            pytest.param("hello\tworld\n", 1, 7, 6, id="tabs_in_text"),
+            # "   \n " = 5 bytes
+            pytest.param("   \n   \n", 2, 2, 5, id="only_whitespace"),
+            pytest.param("hello", 1, 3, 2, id="single_line_no_newline"),
+        ],
+    )
+    def test_byte_offset(self, text, line, col, expected):
+        """Simple positions map to the expected offset."""
+        assert byte_offset(text, line, col) == expected
 
     def test_line_out_of_bounds_high(self):
         """Line number exceeds file length."""
@@ -100,12 +88,6 @@ class TestByteOffset:
         # "a\n" (2) + "bb\n" (3) + "ccc\n" (4) = 9 bytes to line 4, then col 4 = +3
         assert byte_offset(text, 4, 4) == 12  # "a\nbb\nccc\nddd" = 12
 
-    def test_no_trailing_newline(self):
-        """Text without trailing newline."""
-        text = "hello\nworld"  # No final \n
-        # Line 2, col 1
-        assert byte_offset(text, 2, 1) == 6  # "hello\n" = 6
-
     def test_windows_line_endings(self):
         """Text with CRLF (\r\n) line endings."""
         text = "hello\r\nworld\r\n"
@@ -149,24 +131,6 @@ class TestByteOffset:
         # Line 2, col 1
         assert byte_offset(text, 2, 1) == len("hello 👋\n")
 
-    def test_tabs_in_text(self):
-        """Text with tab characters."""
-        text = "hello\tworld\n"
-        # Line 1, col 7 = 'w'
-        assert byte_offset(text, 1, 7) == 6  # "hello\t" = 6 bytes
-
-    def test_only_whitespace(self):
-        """Text with only whitespace."""
-        text = "   \n   \n"
-        # Line 2, col 2
-        assert byte_offset(text, 2, 2) == 5  # "   \n " = 5 bytes
-
-    def test_single_line_no_newline(self):
-        """Single line with no newline."""
-        text = "hello"
-        # Line 1, col 3
-        assert byte_offset(text, 1, 3) == 2
-
     def test_splitlines_keepends_behavior(self):
         """Verify splitlines(True) behavior is correct."""
         text = "a\nb\nc"
@@ -181,6 +145,33 @@ class TestByteOffset:
 class TestRelTo:
     """Test rel_to() function with all edge cases."""
 
+    @pytest.mark.parametrize(
+        "root,path,expected_parts",
+        [
+            # Resolves to /home/user/other/file.py (outside root): absolute fallback
+            pytest.param("/home/user/project", "/home/user/project/../other/file.py",
+                         ["file.py"], id="parent_references"),
+            # Relative path is computed even if nothing exists on disk
+            pytest.param("/nonexistent/root", "/nonexistent/root/subdir/file.txt",
+                         ["subdir", "file.txt"], id="nonexistent"),
+            pytest.param("/home/user/Project", "/home/user/Project/src/file.py",
+                         ["file.py"], id="case_sensitivity"),
+            pytest.param("/home/user/project/", "/home/user/project/src/file.py",
+                         ["src", "file.py"], id="trailing_slash"),
+            # relative_to fails: should not crash, returns absolute path
+            pytest.param("/completely/different/path", "/another/path/file.py",
+                         ["file.py"], id="exception_handling"),
+            # Empty components (like //) are normalized
+            pytest.param("/home//user///project", "/home/user/project/src/file.py",
+                         ["file.py"], id="empty_path_components"),
+        ],
+    )
+    def test_rel_to_contains(self, root, path, expected_parts):
+        """Result names the expected path components."""
+        result = rel_to(pathlib.Path(root), pathlib.Path(path))
+        for part in expected_parts:
+            assert part in result
+
     def test_path_inside_root(self):
         """Path inside root returns relative path."""
         root = pathlib.Path("/home/user/project")
@@ -207,23 +198,6 @@ class TestRelTo:
                 (len(result) > 2 and result[1:3] == ":\\"))
         assert "config.txt" in result
 
-    def test_path_with_parent_references(self):
-        """Path with .. that escapes root."""
-        root = pathlib.Path("/home/user/project")
-        path = pathlib.Path("/home/user/project/../other/file.py")
-        # Resolving this gives /home/user/other/file.py (outside root)
-        result = rel_to(root, path)
-        # Should fall back to absolute path
-        assert "file.py" in result
-
-    def test_root_and_path_nonexistent(self):
-        """Non-existent paths still work."""
-        root = pathlib.Path("/nonexistent/root")
-        path = pathlib.Path("/nonexistent/root/subdir/file.txt")
-        result = rel_to(root, path)
-        # Should compute relative path even if doesn't exist
-        assert "subdir" in result and "file.txt" in result
-
     def test_windows_paths(self):
         """Windows-style paths."""
         root = pathlib.Path("C:/Users/Dev/project")
@@ -244,21 +218,6 @@ class TestRelTo:
             # Cannot make relative, should return absolute
             assert "D:" in result or result.startswith("/")
 
-    def test_case_sensitivity(self):
-        """Path case handling (platform-dependent)."""
-        root = pathlib.Path("/home/user/Project")
-        path = pathlib.Path("/home/user/Project/src/file.py")
-        result = rel_to(root, path)
-        # Should work regardless of case
-        assert "file.py" in result
-
-    def test_trailing_slash(self):
-        """Root with trailing slash."""
-        root = pathlib.Path("/home/user/project/")
-        path = pathlib.Path("/home/user/project/src/file.py")
-        result = rel_to(root, path)
-        assert "src" in result and "file.py" in result
-
     def test_symlinks(self):
         """Paths involving symlinks."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -279,15 +238,6 @@ class TestRelTo:
         # Should resolve correctly
         assert "file.py" in result
 
-    def test_exception_handling(self):
-        """Verify exception handling returns absolute path."""
-        # Create a scenario where relative_to might fail
-        root = pathlib.Path("/completely/different/path")
-        path = pathlib.Path("/another/path/file.py")
-        result = rel_to(root, path)
-        # Should not crash, should return absolute path
-        assert "file.py" in result
-
     def test_returns_string(self):
         """Result is always a string."""
         root = pathlib.Path("/home/user/project")
@@ -295,10 +245,3 @@ class TestRelTo:
         result = rel_to(root, path)
         assert isinstance(result, str)
 
-    def test_empty_path_components(self):
-        """Paths with empty components (like //)."""
-        root = pathlib.Path("/home//user///project")
-        path = pathlib.Path("/home/user/project/src/file.py")
-        result = rel_to(root, path)
-        # Should normalize and compute relative path
-        assert "file.py" in result
@@ -1,27 +1,131 @@
 """Test utilities and helper functions."""
 
+import hashlib
+import json
+import os
+import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Union
 import httpx
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-def create_python_file(path: Path, content: str) -> Path:
+
+def create_python_file(path: Path, content: Union[str, bytes]) -> Path:
     """
     Helper: create .py file with content.
 
     Args:
         path: Path to the file to create
-        content: Python code content
+        content: Python code content (str, or pre-encoded UTF-8 bytes)
 
     Returns:
         Path to the created file
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    path.write_bytes(content if isinstance(content, bytes) else content.encode("utf-8"))
     return path
 
 
+def create_python_files(root: Path, files: Dict[str, Union[str, bytes]]) -> Path:
+    """
+    Helper: create several .py files under root, writing them concurrently.
+
+    Falls back to sequential writes on single-CPU machines.
+
+    Args:
+        root: Directory the relative paths are resolved against
+        files: Mapping of relative file path to Python code content (str or bytes)
+
+    Returns:
+        The root path
+    """
+    items = [(root / name, content) for name, content in files.items()]
+
+    if os.cpu_count() == 1 or len(items) < 2:
+        for path, content in items:
+            create_python_file(path, content)
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+            list(executor.map(lambda item: create_python_file(*item), items))
+
+    return root
+
+
+def ignore_non_python(directory: str, names: List[str]) -> List[str]:
+    """
+    Helper: shutil.copytree ignore callback that skips caches and non-.py files.
+
+    Directories are kept so nested packages are copied.
+
+    Args:
+        directory: Directory being copied
+        names: Entries of that directory
+
+    Returns:
+        The entries to skip
+    """
+    return [
+        name for name in names
+        if name == "__pycache__"
+        or (not name.endswith(".py") and not os.path.isdir(os.path.join(directory, name)))
+    ]
+
+
+def link_or_copy(src: str, dst: str) -> str:
+    """
+    Helper: hardlink src to dst, falling back to a copy across devices.
+
+    Usable as a shutil.copytree copy_function. Only use it for workspaces
+    whose existing files are never modified: writing to a linked file edits
+    the original.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        The destination path
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+    return dst
+
+
+def tree_digest(root: Path) -> str:
+    """
+    Helper: content digest of every .py file under root.
+
+    Paths are hashed relative to root, so identical trees materialized in
+    different directories share a digest. Rope's own .ropeproject folder
+    is ignored.
+
+    Args:
+        root: Project root directory
+
+    Returns:
+        Hex digest of the tree's relative paths and file contents
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(root.rglob("*.py")):
+        relative = path.relative_to(root)
+        if ".ropeproject" in relative.parts:
+            continue
+        digest.update(relative.as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
 def wait_for_server_ready(port: int, timeout: float = 2.0) -> bool:
     """
     Helper: poll /health until ready or timeout.
@@ -80,7 +184,7 @@ def assert_patches_valid(patches: Dict[str, str]):
     Raises:
         AssertionError: If patches structure is invalid
     """
-    assert isinstance(patches, dict), "Patches must be a dictionary"
+    assert type(patches) is dict, "Patches must be a dictionary"
 
     for file_path, content in patches.items():
         assert isinstance(file_path, str), f"File path must be string, got {type(file_path)}"
@@ -99,7 +203,7 @@ def assert_location_valid(location: dict, expected_file: Optional[str] = None):
     Raises:
         AssertionError: If location structure is invalid
     """
-    assert isinstance(location, dict), "Location must be a dictionary"
+    assert type(location) is dict, "Location must be a dictionary"
     assert "file" in location, "Location must have 'file' key"
     assert "line" in location, "Location must have 'line' key"
     assert "column" in location, "Location must have 'column' key"
@@ -124,11 +228,11 @@ def assert_locations_response(response_data: dict, min_count: int = 1):
     Raises:
         AssertionError: If response structure is invalid
     """
-    assert isinstance(response_data, dict), "Response must be a dictionary"
+    assert type(response_data) is dict, "Response must be a dictionary"
     assert "locations" in response_data, "Response must have 'locations' key"
 
     locations = response_data["locations"]
-    assert isinstance(locations, list), "Locations must be a list"
+    assert type(locations) is list, "Locations must be a list"
     assert len(locations) >= min_count, f"Expected at least {min_count} locations, got {len(locations)}"
 
     for loc in locations:
@@ -145,7 +249,7 @@ def assert_health_response(response_data: dict):
     Raises:
         AssertionError: If response structure is invalid
     """
-    assert isinstance(response_data, dict), "Response must be a dictionary"
+    assert type(response_data) is dict, "Response must be a dictionary"
     assert "status" in response_data, "Response must have 'status' key"
     assert "workspace" in response_data, "Response must have 'workspace' key"
     assert "uptime" in response_data, "Response must have 'uptime' key"
@@ -183,6 +287,44 @@ def make_request(client, endpoint: str, method: str = "POST", **kwargs):
         raise ValueError(f"Unsupported method: {method}")
 
 
+def post_json(client, endpoint: str, payload: dict, expected_status: int = 200) -> dict:
+    """
+    Helper: POST a JSON payload, assert the status code and parse the body once.
+
+    Uses orjson for parsing when it is installed.
+
+    Args:
+        client: TestClient instance
+        endpoint: API endpoint path
+        payload: JSON request body
+        expected_status: Status code the response must have
+
+    Returns:
+        Parsed JSON response body
+
+    Raises:
+        AssertionError: If the response status does not match
+    """
+    response = client.post(endpoint, json=payload)
+    assert response.status_code == expected_status, response.text
+    return parse_json(response.content)
+
+
+def parse_json(data: Union[str, bytes]):
+    """
+    Helper: parse a JSON document, using orjson when it is installed.
+
+    Args:
+        data: JSON text, e.g. captured stdout or a raw response body
+
+    Returns:
+        Parsed JSON value
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def get_relative_path(workspace: Path, file_path: Path) -> str:
     """
     Helper: get relative path from workspace.